@@ -1,13 +1,14 @@
 
 from typing import List, Optional
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db import get_db
-from app.repositories.job_repository import JobRepository
+from app.db import get_db, get_db_readonly
 from app.schemas.job_schemas import (
     JobCreate,
     JobResponse,
+    JobResponseList,
+    JobPage,
     JobUpdate,
     JobStats,
     BulkJobCreate,
@@ -19,126 +20,129 @@ from app.services.job_service import JobService
 
 router = APIRouter()
 
-repo = JobRepository()
-service = JobService(repo)
 
-def get_service() -> JobService:
-    return service
+def _service(request: Request) -> JobService:
+    """JobService singleton built in the application lifespan"""
+    return request.app.state.job_service
 
 @router.post("/jobs", response_model=JobResponse, status_code=201)
 async def create_job(
+        request: Request,
         job_data: JobCreate,
-        db: AsyncSession = Depends(get_db),
-        svc: JobService = Depends(get_service)
+        db: AsyncSession = Depends(get_db)
 ):
-    return await JobService.create_job(svc, job_data, db)
+    return await _service(request).create_job(job_data, db)
 
 
 @router.post("/jobs/bulk", response_model=BulkJobResponse, status_code=201)
 async def create_jobs_bulk(
+        request: Request,
         bulk_data: BulkJobCreate,
-        db: AsyncSession = Depends(get_db),
-        svc: JobService = Depends(get_service)
+        db: AsyncSession = Depends(get_db)
 ):
-    return await JobService.create_jobs_bulk(svc, bulk_data, db)
+    return await _service(request).create_jobs_bulk(bulk_data, db)
 
-@router.get("/jobs", response_model=List[JobResponse])
+@router.get("/jobs", response_model=JobPage)
 async def list_jobs(
+        request: Request,
         queue_name: Optional[str] = Query(None, description="Filter by queue name"),
         status: Optional[QueueStatus] = Query(None, description="Filter by job status"),
         job_type: Optional[JobTypes] = Query(None, description="Filter by job type"),
-        skip: int = Query(0, ge=0, description="Number of jobs to skip"),
+        after_id: Optional[int] = Query(None, ge=0, description="Return jobs after this id (next_cursor of the previous page)"),
         limit: int = Query(50, ge=1, le=1000, description="Maximum jobs to return"),
-        db: AsyncSession = Depends(get_db),
-        svc: JobService = Depends(get_service)
+        db: AsyncSession = Depends(get_db_readonly)
 ):
-    return await JobService.list_jobs(svc, queue_name, status, job_type, skip, limit, db)
+    page = await _service(request).list_jobs(queue_name, status, job_type, after_id, limit, db)
+    # Serialized in one pass; response_model is kept for the OpenAPI schema only.
+    # Rows are built with model_construct, so enum fields hold plain strings.
+    return Response(page.model_dump_json(warnings=False), media_type="application/json")
 
 
 @router.get("/jobs/{job_id}", response_model=JobResponse)
 async def get_job(
+        request: Request,
         job_id: int,
-        db: AsyncSession = Depends(get_db),
-        svc: JobService = Depends(get_service)
+        db: AsyncSession = Depends(get_db_readonly)
 ):
-    return await JobService.get_job(svc, job_id, db)
+    return await _service(request).get_job(job_id, db)
 
 @router.put("/jobs/{job_id}", response_model=JobResponse)
 async def update_job(
+        request: Request,
         job_id: int,
         job_update: JobUpdate,
-        db: AsyncSession = Depends(get_db),
-        svc: JobService = Depends(get_service)
+        db: AsyncSession = Depends(get_db)
 ):
-    return await JobService.update_job(svc, job_id, job_update, db)
+    return await _service(request).update_job(job_id, job_update, db)
 
 @router.delete("/jobs/{job_id}")
 async def cancel_job(
+        request: Request,
         job_id: int,
-        db: AsyncSession = Depends(get_db),
-        svc: JobService = Depends(get_service)
+        db: AsyncSession = Depends(get_db)
 ):
-    return await JobService.cancel_job(svc, job_id, db)
+    return await _service(request).cancel_job(job_id, db)
 
 @router.post("/jobs/{job_id}/retry", response_model=JobResponse)
 async def retry_job(
+        request: Request,
         job_id: int,
         reset_attempts: bool = Query(False, description="Reset attempt count to 0"),
-        svc: JobService = Depends(get_service),
-        db: AsyncSession = Depends(get_db),
+        db: AsyncSession = Depends(get_db)
 ):
-    return await JobService.retry_job(svc, job_id, reset_attempts, db)
+    return await _service(request).retry_job(job_id, reset_attempts, db)
 
 @router.get("/jobs/stats/overview", response_model=JobStats)
 async def get_job_stats(
-        db: AsyncSession = Depends(get_db),
-        svc: JobService = Depends(get_service)
+        request: Request,
+        db: AsyncSession = Depends(get_db_readonly)
 ):
-    return await JobService.get_job_stats(svc, db)
+    return await _service(request).get_job_stats(db)
 
 
 @router.get("/jobs/queue/{queue_name}", response_model=List[JobResponse])
 async def get_jobs_by_queue(
+        request: Request,
         queue_name: str,
         status: Optional[QueueStatus] = Query(None, description="Filter by status"),
         limit: int = Query(50, ge=1, le=1000),
-        db: AsyncSession = Depends(get_db),
-        svc: JobService = Depends(get_service)
+        db: AsyncSession = Depends(get_db_readonly)
 ):
-    return await JobService.get_jobs_by_queue(svc, queue_name, status, limit, db)
+    jobs = await _service(request).get_jobs_by_queue(queue_name, status, limit, db)
+    return Response(JobResponseList.dump_json(jobs, warnings=False), media_type="application/json")
 
 # Health check endpoints
 @router.get("/jobs/health/pending-count")
 async def get_pending_jobs_count(
+        request: Request,
         queue_name: Optional[str] = Query(None),
-        db: AsyncSession = Depends(get_db),
-        svc: JobService = Depends(get_service)
+        db: AsyncSession = Depends(get_db_readonly)
 ):
-    return await JobService.get_pending_jobs_count(svc, queue_name, db)
+    return await _service(request).get_pending_jobs_count(queue_name, db)
 
 
 @router.get("/jobs/health/running-count")
 async def get_running_jobs_count(
+        request: Request,
         queue_name: Optional[str] = Query(None),
-        db: AsyncSession = Depends(get_db),
-        svc: JobService = Depends(get_service)
+        db: AsyncSession = Depends(get_db_readonly)
 ):
-    return JobService.get_running_jobs_count(svc, queue_name, db)
+    return await _service(request).get_running_jobs_count(queue_name, db)
 
 
 # Admin endpoints
 @router.post("/admin/jobs/reset-stale")
 async def reset_stale_jobs(
+        request: Request,
         timeout_minutes: int = Query(30, ge=1, description="Minutes after which running jobs are considered stale"),
-        db: AsyncSession = Depends(get_db),
-        svc: JobService = Depends(get_service)
+        db: AsyncSession = Depends(get_db)
 ):
-    return JobService.reset_stale_jobs(svc, timeout_minutes, db)
+    return await _service(request).reset_stale_jobs(timeout_minutes, db)
 
 @router.delete("/admin/jobs/cleanup")
 async def cleanup_completed_jobs(
+        request: Request,
         older_than_days: int = Query(7, ge=1, description="Delete completed jobs older than this many days"),
-        db: AsyncSession = Depends(get_db),
-        svc: JobService = Depends(get_service)
+        db: AsyncSession = Depends(get_db)
 ):
-    return JobService.cleanup_completed_jobs(svc, older_than_days, db)
\ No newline at end of file
+    return await _service(request).cleanup_completed_jobs(older_than_days, db)
\ No newline at end of file
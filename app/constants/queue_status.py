@@ -1,9 +1,12 @@
 from enum import Enum
 
 
-class QueueStatus(Enum):
+class QueueStatus(str, Enum):
     pending = "pending"
     running = "running"
     completed = "completed"
     failed = "failed"
-    cancelled = "cancelled"
\ No newline at end of file
+    cancelled = "cancelled"
+
+    def __str__(self) -> str:
+        return self.value
\ No newline at end of file
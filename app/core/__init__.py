@@ -1,6 +1,7 @@
 from app.core import config
+from app.core import setup_logger
 from app.core.config import settings
-from app.core.setup_logger import get_logger, api_logger, worker_logger, db_logger
+from app.core.setup_logger import get_logger, get_api_logger, get_worker_logger, get_db_logger
 
 __all__ = [
     'config',
@@ -9,4 +10,14 @@ __all__ = [
     'db_logger',
     'get_logger',
     'api_logger',
-]
\ No newline at end of file
+    'get_api_logger',
+    'get_worker_logger',
+    'get_db_logger',
+]
+
+
+def __getattr__(name: str):
+    # api_logger / worker_logger / db_logger are created lazily by setup_logger
+    if name in ('api_logger', 'worker_logger', 'db_logger'):
+        return getattr(setup_logger, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
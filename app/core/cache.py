@@ -0,0 +1,111 @@
+"""
+In-process TTL cache
+Short-lived memoization for hot, read-mostly values such as queue statistics
+"""
+import asyncio
+import time
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    Async-aware cache whose entries expire after a fixed number of seconds
+
+    Concurrent misses on the same key share one load, so N pollers hitting an
+    expired entry trigger a single database query instead of N. At most
+    max_entries keys are kept; the least recently used one is evicted first.
+    """
+
+    def __init__(self, ttl: float, max_entries: int = 1024):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._locks: Dict[Hashable, asyncio.Lock] = {}
+        # Bumped by clear(); a load that started before a clear isn't stored
+        self._generation = 0
+
+    def _lookup(self, key: Hashable) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return _MISSING
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            self._entries.pop(key, None)
+            return _MISSING
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value for ttl seconds, evicting the least recently used key if full"""
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        """Drop a single entry"""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every entry, and keep loads already in flight from storing theirs"""
+        self._entries.clear()
+        self._generation += 1
+
+    async def get_or_load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Return the cached value for key, loading it on a miss
+
+        Args:
+            key: Cache key
+            loader: Zero-argument coroutine function producing the value
+
+        Returns:
+            Cached or freshly loaded value
+        """
+        value = self._lookup(key)
+        if value is not _MISSING:
+            return value
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            # Another caller may have filled the entry while we waited
+            value = self._lookup(key)
+            if value is not _MISSING:
+                return value
+
+            try:
+                generation = self._generation
+                value = await loader()
+                if generation == self._generation:
+                    self.set(key, value)
+            finally:
+                # Later callers hit the entry; don't keep a lock per key ever seen
+                self._locks.pop(key, None)
+            return value
+
+
+def cached(key: Callable[..., Hashable]):
+    """
+    Memoize an async method in its instance's `cache` (a TTLCache)
+
+    Args:
+        key: Builds the cache key from the method's arguments (without self)
+
+    Returns:
+        Method decorator
+    """
+    def decorator(method):
+        @wraps(method)
+        async def wrapper(self, *args, **kwargs):
+            return await self.cache.get_or_load(
+                key(*args, **kwargs),
+                lambda: method(self, *args, **kwargs)
+            )
+        return wrapper
+    return decorator
@@ -1,4 +1,4 @@
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from typing import List
 from pydantic_settings import BaseSettings
 from pydantic import ConfigDict
@@ -15,6 +15,15 @@ class Settings(BaseSettings):
 
     # Database settings
     DB_URL: str
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_RECYCLE: int = 1800  # Seconds before a pooled connection is replaced
+    DB_POOL_PRE_PING: bool = False  # Extra round trip on every checkout when enabled
+    DB_ACQUIRE_TIMEOUT: float = 5.0  # Seconds a request waits for a free connection before 503
+    DB_POOL_TIMEOUT: float = 5.0  # Seconds a checkout waits on an exhausted pool before raising
+    DB_STATEMENT_CACHE_SIZE: int = 1024  # Prepared statements cached per connection; 0 behind PgBouncer transaction pooling
+    DB_POOL_WARMUP: int = 5  # Connections opened at startup so first requests/jobs skip the handshake
+    STRICT_RELATIONSHIPS: bool = False  # raiseload('*') on repository queries; enable in dev/test so unplanned lazy loads fail loudly
 
     # Worker Configuration
     POLL_INTERVAL: float = 1.0
@@ -22,6 +31,10 @@ class Settings(BaseSettings):
     BACKOFF_FACTOR: float = 1.5
     MAX_CONCURRENT_JOBS: int = 3  # ← Fixed: Added 'S'
     WORKER_QUEUES: str = "default"
+    WORKER_LISTEN: bool = True  # LISTEN/NOTIFY wakeups; disable behind PgBouncer transaction pooling
+
+    # Seconds that queue statistics and counts are served from cache
+    STATS_CACHE_TTL: float = 3.0
 
     # Application
     ENVIRONMENT: str = "development"
@@ -37,11 +50,11 @@ class Settings(BaseSettings):
         case_sensitive=False
     )
 
-    @property
+    @cached_property
     def database_url(self) -> str:
         return f"postgresql://{self.DB_URL}"
 
-    @property
+    @cached_property
     def async_database_url(self) -> str:
         """Async version for asyncpg/worker processes."""
         return f"postgresql+asyncpg://{self.DB_URL}"
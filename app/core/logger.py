@@ -1,36 +1,62 @@
+import atexit
 import logging
+import queue
 import sys
-import json
 from datetime import datetime
 from pathlib import Path
-from logging.handlers import TimedRotatingFileHandler
+from logging.handlers import TimedRotatingFileHandler, QueueHandler, QueueListener
 
+import orjson
 
-class ColoredLogFormatter(logging.Formatter):
-    """Custom formatter with colors for console output"""
 
-    COLORS = {
-        'DEBUG': '\033[36m',  # Cyan
-        'INFO': '\033[32m',  # Green
-        'WARNING': '\033[33m',  # Yellow
-        'ERROR': '\033[31m',  # Red
-        'CRITICAL': '\033[35m',  # Purple
-        'RESET': '\033[0m'  # Reset
+# ANSI colors per log level, applied on console output
+LEVEL_COLORS = {
+    logging.DEBUG: '\033[36m',  # Cyan
+    logging.INFO: '\033[32m',  # Green
+    logging.WARNING: '\033[33m',  # Yellow
+    logging.ERROR: '\033[31m',  # Red
+    logging.CRITICAL: '\033[35m',  # Purple
+}
+RESET_COLOR = '\033[0m'
+
+
+class LogFormatter(logging.Formatter):
+    """
+    Plain formatter: [timestamp] LEVEL: message
+
+    Level labels come from a table indexed by record.levelno, and the
+    timestamp string is reused for every record logged within the same second.
+    """
+
+    default_time_format = '%Y-%m-%d %H:%M:%S'
+
+    LEVEL_LABELS = {
+        level: logging.getLevelName(level) for level in LEVEL_COLORS
     }
 
-    def format(self, record):
-        timestamp = datetime.fromtimestamp(record.created).strftime('%Y-%m-%d %H:%M:%S')
+    def __init__(self):
+        super().__init__()
+        self._cached_second = None
+        self._cached_timestamp = ''
 
-        # Add color to log level
-        level_name = record.levelname
-        colored_level = f"{self.COLORS.get(level_name, '')}{level_name}{self.COLORS['RESET']}"
+    def _timestamp(self, record):
+        second = int(record.created)
+        if second != self._cached_second:
+            self._cached_timestamp = self.formatTime(record, self.default_time_format)
+            self._cached_second = second
+        return self._cached_timestamp
+
+    def format(self, record):
+        level_label = self.LEVEL_LABELS.get(record.levelno) or record.levelname
 
         # Format like Laravel: [timestamp] LEVEL: message
-        log_entry = f"[{timestamp}] {colored_level}: {record.getMessage()}"
+        log_entry = f"[{self._timestamp(record)}] {level_label}: {record.getMessage()}"
 
         # Add exception info if present
         if record.exc_info:
-            log_entry += f"\n{self.formatException(record.exc_info)}"
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+            log_entry += f"\n{record.exc_text}"
 
         # Add stack trace if available
         if hasattr(record, 'stack') and record.stack:
@@ -39,7 +65,7 @@ class ColoredLogFormatter(logging.Formatter):
         # Add context data if available
         if hasattr(record, 'context') and record.context:
             try:
-                context_str = json.dumps(record.context, indent=2)
+                context_str = orjson.dumps(record.context, default=str).decode()
                 log_entry += f"\nContext: {context_str}"
             except Exception:
                 log_entry += f"\nContext: {record.context}"
@@ -47,32 +73,30 @@ class ColoredLogFormatter(logging.Formatter):
         return log_entry
 
 
-class FileLogFormatter(logging.Formatter):
-    """Plain formatter for file output (no colors)"""
+class ColoredLogFormatter(LogFormatter):
+    """Custom formatter with colors for console output"""
 
-    def format(self, record):
-        timestamp = datetime.fromtimestamp(record.created).strftime('%Y-%m-%d %H:%M:%S')
+    LEVEL_LABELS = {
+        level: f"{color}{logging.getLevelName(level)}{RESET_COLOR}"
+        for level, color in LEVEL_COLORS.items()
+    }
 
-        # Plain text without colors
-        log_entry = f"[{timestamp}] {record.levelname}: {record.getMessage()}"
 
-        # Add exception info if present
-        if record.exc_info:
-            log_entry += f"\n{self.formatException(record.exc_info)}"
+class FileLogFormatter(LogFormatter):
+    """Plain formatter for file output (no colors)"""
 
-        # Add stack trace if available
-        if hasattr(record, 'stack') and record.stack:
-            log_entry += f"\nStack trace:\n{record.stack}"
 
-        # Add context data if available
-        if hasattr(record, 'context') and record.context:
-            try:
-                context_str = json.dumps(record.context, indent=2)
-                log_entry += f"\nContext: {context_str}"
-            except Exception:
-                log_entry += f"\nContext: {record.context}"
+class InProcessQueueHandler(QueueHandler):
+    """
+    QueueHandler that enqueues records untouched
 
-        return log_entry
+    The queue never leaves the process, so there is no need to pre-format
+    records in the caller's thread - formatting and file I/O both happen on
+    the QueueListener thread instead of the event loop.
+    """
+
+    def prepare(self, record):
+        return record
 
 
 def setup_logging(
@@ -84,6 +108,8 @@ def setup_logging(
     """
     Configure application-wide logging with daily rotation
 
+    The logger itself only enqueues records; a background QueueListener
+    thread formats them and writes to the console and log file.
     """
     # Create a named logger (not root logger)
     logger_instance = logging.getLogger(app_name)
@@ -93,10 +119,12 @@ def setup_logging(
     if logger_instance.handlers:
         return logger_instance
 
-    # Create console handler with colors
+    # Create console handler; colors only when attached to a terminal
     console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setFormatter(ColoredLogFormatter())
-    logger_instance.addHandler(console_handler)
+    if sys.stdout.isatty():
+        console_handler.setFormatter(ColoredLogFormatter())
+    else:
+        console_handler.setFormatter(FileLogFormatter())
 
     # Create log directory if it doesn't exist
     log_path = Path(log_dir)
@@ -126,7 +154,17 @@ def setup_logging(
 
     # Use plain formatter for files (no colors)
     file_handler.setFormatter(FileLogFormatter())
-    logger_instance.addHandler(file_handler)
+
+    # Hand records to a background thread so writes never block the caller
+    log_queue = queue.Queue(-1)
+    logger_instance.addHandler(InProcessQueueHandler(log_queue))
+
+    listener = QueueListener(log_queue, console_handler, file_handler)
+    listener.start()
+    atexit.register(listener.stop)
+
+    # Keep a reference so the listener lives as long as the logger
+    logger_instance.queue_listener = listener
 
     return logger_instance
 
@@ -1,34 +1,61 @@
 """
 Centralized logger factory for the application
 Provides separate loggers for API, Worker, and other components
+
+Loggers are built on first use, so a process only opens the log files it
+actually writes to. `api_logger`, `worker_logger` and `db_logger` remain
+importable as module attributes and resolve through their factories.
 """
 import logging
+from functools import lru_cache
 
 from app.core.logger import setup_logging
 
-# API Logger - for FastAPI application
-api_logger = setup_logging(
-    log_level=logging.INFO,
-    log_dir='logs',
-    app_name='api',
-    backup_count=30
-)
-
-# Worker Logger - for background job processing
-worker_logger = setup_logging(
-    log_level=logging.INFO,
-    log_dir='logs',
-    app_name='worker',
-    backup_count=30
-)
-
-# Database Logger - for database operations (optional)
-db_logger = setup_logging(
-    log_level=logging.WARNING,  # Only log warnings and errors
-    log_dir='logs',
-    app_name='db',
-    backup_count=30
-)
+
+@lru_cache()
+def get_api_logger() -> logging.Logger:
+    """API Logger - for FastAPI application"""
+    return setup_logging(
+        log_level=logging.INFO,
+        log_dir='logs',
+        app_name='api',
+        backup_count=30
+    )
+
+
+@lru_cache()
+def get_worker_logger() -> logging.Logger:
+    """Worker Logger - for background job processing"""
+    return setup_logging(
+        log_level=logging.INFO,
+        log_dir='logs',
+        app_name='worker',
+        backup_count=30
+    )
+
+
+@lru_cache()
+def get_db_logger() -> logging.Logger:
+    """Database Logger - for database operations (warnings and errors only)"""
+    return setup_logging(
+        log_level=logging.WARNING,
+        log_dir='logs',
+        app_name='db',
+        backup_count=30
+    )
+
+
+_LOGGER_FACTORIES = {
+    'api': get_api_logger,
+    'worker': get_worker_logger,
+    'database': get_db_logger,
+}
+
+_LAZY_LOGGERS = {
+    'api_logger': get_api_logger,
+    'worker_logger': get_worker_logger,
+    'db_logger': get_db_logger,
+}
 
 
 def get_logger(name: str):
@@ -41,12 +68,13 @@ def get_logger(name: str):
     Returns:
         Logger instance
     """
-    loggers = {
-        'api': api_logger,
-        'worker': worker_logger,
-        'database': db_logger
-    }
-
-    return loggers.get(name, api_logger)  # Default to api_logger
+    factory = _LOGGER_FACTORIES.get(name, get_api_logger)  # Default to api_logger
+    return factory()
 
 
+def __getattr__(name: str):
+    """Build api_logger / worker_logger / db_logger on first access"""
+    factory = _LAZY_LOGGERS.get(name)
+    if factory is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return factory()
@@ -1,6 +1,9 @@
-from app.db.database import get_db, Base
+from app.db.database import get_db, get_db_readonly, Base
+from app.db.middleware import DBSessionMiddleware
 
 __all__ = [
     'get_db',
+    'get_db_readonly',
     'Base',
+    'DBSessionMiddleware',
 ]
\ No newline at end of file
@@ -5,29 +5,48 @@ Run this once to set up the database schema.
 """
 import asyncio
 
-from sqlalchemy.ext.asyncio.engine import create_async_engine
+from sqlalchemy import text
 
-from app.core import settings
-from app.db.database import init_database, Base
+from app.db import database
+from app.db.database import init_database, close_database, Base
+from app.models import Jobs  # noqa: F401 - registers the tables on Base.metadata
 
-async def create_tables():
-    engine = create_async_engine(
-        settings.async_database_url,
-        pool_pre_ping=True,
-        echo=True  # Show SQL commands
-    )
+# Indexes superseded by the partial indexes on Jobs
+OBSOLETE_INDEXES = ["ix_jobs_status", "ix_jobs_scheduled_at", "ix_jobs_running", "ix_jobs_pending"]
+
+# Columns filled from the database clock; create_all doesn't add defaults to existing tables
+NOW_DEFAULT_COLUMNS = ["created_at", "updated_at", "scheduled_at"]
 
+
+async def create_tables():
     """Create all database tables."""
+    # Reuses the application engine; SQL is echoed only when DEBUG is set
     await init_database()
 
     print("Creating database tables...")
 
     # Create all tables
-    async with engine.begin() as conn:
+    async with database.engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
+        # create_all skips existing tables, so add any indexes they are missing
+        for index in Jobs.__table__.indexes:
+            await conn.run_sync(index.create, checkfirst=True)
+
+        for name in OBSOLETE_INDEXES:
+            await conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
+
+        for name in NOW_DEFAULT_COLUMNS:
+            await conn.execute(text(f"ALTER TABLE {Jobs.__tablename__} ALTER COLUMN {name} SET DEFAULT now()"))
+
     print("Database tables created successfully!")
 
 
 if __name__ == "__main__":
-    asyncio.run(create_tables())
\ No newline at end of file
+    async def main():
+        try:
+            await create_tables()
+        finally:
+            await close_database()
+
+    asyncio.run(main())
@@ -1,52 +1,124 @@
 import asyncio
-from typing import AsyncGenerator
+from typing import Any, Optional
+
+import orjson
+from fastapi import HTTPException, Request
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy import text
 
 from app.core.config import settings
+from app.core.logger import info, warning
+from app.core.setup_logger import get_db_logger
+
 
+def _json_serializer(value: Any) -> str:
+    """orjson in place of json.dumps for JSON/JSONB bind values"""
+    return orjson.dumps(value).decode()
 
-async def connect_with_retry(retries=5, delay=3):
+
+async def connect_with_retry(retries=5, delay=3, pool_pre_ping: Optional[bool] = None):
     """Create async engine with retry logic."""
+    if pool_pre_ping is None:
+        pool_pre_ping = settings.DB_POOL_PRE_PING
+
     for attempt in range(retries):
         try:
             engine = create_async_engine(
                 settings.async_database_url,
-                pool_pre_ping=True,
-                pool_size=5,
-                max_overflow=10,
+                pool_pre_ping=pool_pre_ping,
+                pool_size=settings.DB_POOL_SIZE,
+                max_overflow=settings.DB_MAX_OVERFLOW,
+                pool_recycle=settings.DB_POOL_RECYCLE,
+                pool_timeout=settings.DB_POOL_TIMEOUT,
+                # Hot claim/enqueue/update statements are parsed and planned once per connection
+                connect_args={
+                    "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+                    "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+                },
+                json_serializer=_json_serializer,
+                json_deserializer=orjson.loads,
                 echo=settings.DEBUG  # Show SQL queries in debug mode
             )
-            # Test the connection
+            # Test the connection once here instead of pinging on every checkout
             async with engine.begin() as connection:
                 await connection.execute(text("SELECT 1"))
             return engine
         except Exception as e:
             if attempt == retries - 1:
                 raise
-            print(f"Database connection attempt {attempt + 1} failed, retrying in {delay} seconds...")
+            warning(get_db_logger(), "Database connection attempt failed, retrying", context={
+                "attempt": attempt + 1,
+                "retry_in_seconds": delay,
+                "error": str(e)
+            })
             await asyncio.sleep(delay)
 
 
+async def warm_pool(engine, size: int):
+    """
+    Open size connections concurrently, ping each once and hand them back
+    to the pool, so the first requests or jobs don't pay connection setup.
+    """
+    size = min(size, settings.DB_POOL_SIZE)
+    if size <= 0:
+        return
+
+    # Collect failures instead of raising mid-gather, so every connection that
+    # did open is closed (and no ping is still running when it is)
+    results = await asyncio.gather(*(engine.connect() for _ in range(size)), return_exceptions=True)
+    connections = [result for result in results if not isinstance(result, BaseException)]
+    errors = [result for result in results if isinstance(result, BaseException)]
+
+    if not errors:
+        pings = await asyncio.gather(
+            *(connection.execute(text("SELECT 1")) for connection in connections),
+            return_exceptions=True
+        )
+        errors = [result for result in pings if isinstance(result, BaseException)]
+
+    await asyncio.gather(*(connection.close() for connection in connections), return_exceptions=True)
+    if errors:
+        raise errors[0]
+
+
 # Create async engine and session factory
 engine = None
 SessionLocal = None
+ReadOnlySessionLocal = None
 Base = declarative_base()
 
+# Admission control for request sessions, sized to the pool's total capacity
+db_slots: Optional[asyncio.Semaphore] = None
 
-async def init_database():
-    """Initialize database connection."""
-    global engine, SessionLocal
+
+async def init_database(pool_pre_ping: Optional[bool] = None):
+    """
+    Initialize database connection.
+
+    Args:
+        pool_pre_ping: Override DB_POOL_PRE_PING for this process
+    """
+    global engine, SessionLocal, ReadOnlySessionLocal, db_slots
 
     if engine is None:
-        engine = await connect_with_retry()
+        engine = await connect_with_retry(pool_pre_ping=pool_pre_ping)
+        await warm_pool(engine, settings.DB_POOL_WARMUP)
         SessionLocal = async_sessionmaker(
             bind=engine,
             class_=AsyncSession,
             expire_on_commit=False
         )
-        print("Async database connection initialized")
+        # Same pool, but statements autocommit so reads never need a COMMIT round trip
+        ReadOnlySessionLocal = async_sessionmaker(
+            bind=engine.execution_options(isolation_level="AUTOCOMMIT"),
+            class_=AsyncSession,
+            expire_on_commit=False
+        )
+        db_slots = asyncio.Semaphore(settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW)
+        info(get_db_logger(), "Async database connection initialized", context={
+            "warm_connections": min(settings.DB_POOL_WARMUP, settings.DB_POOL_SIZE)
+        })
 
 
 async def close_database():
@@ -54,18 +126,52 @@ async def close_database():
     global engine
     if engine:
         await engine.dispose()
-        print("Database connections closed")
+        info(get_db_logger(), "Database connections closed")
 
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    """FastAPI dependency for async database sessions."""
-    if SessionLocal is None:
-        await init_database()
+async def _request_session(request: Request, readonly: bool) -> AsyncSession:
+    session = getattr(request.state, "db", None)
+    if session is None:
+        if SessionLocal is None:
+            await init_database()
 
-    async with SessionLocal() as session:
         try:
-            yield session
-            await session.commit()
-        except Exception:
-            await session.rollback()
-            raise
\ No newline at end of file
+            await asyncio.wait_for(db_slots.acquire(), timeout=settings.DB_ACQUIRE_TIMEOUT)
+        except asyncio.TimeoutError:
+            raise HTTPException(status_code=503, detail="Database busy, try again later")
+
+        session = ReadOnlySessionLocal() if readonly else SessionLocal()
+        request.state.db = session
+        request.state.db_readonly = readonly
+
+    return session
+
+
+async def get_db(request: Request) -> AsyncSession:
+    """
+    FastAPI dependency for async database sessions.
+
+    Returns the session bound to the current request, creating it on first use.
+    Commit/rollback/close is handled once per request by DBSessionMiddleware.
+
+    Sessions are only handed out while the pool has capacity; a request that
+    cannot get a slot within DB_ACQUIRE_TIMEOUT is rejected with 503 instead
+    of queueing on the pool indefinitely.
+    """
+    return await _request_session(request, readonly=False)
+
+
+async def get_db_readonly(request: Request) -> AsyncSession:
+    """
+    FastAPI dependency for endpoints that only read.
+
+    The session runs in autocommit mode, so the request finishes without a
+    COMMIT round trip; DBSessionMiddleware only closes it.
+    """
+    return await _request_session(request, readonly=True)
+
+
+def release_db_slot() -> None:
+    """Return the admission slot taken by get_db once its session is closed."""
+    if db_slots is not None:
+        db_slots.release()
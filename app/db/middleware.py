@@ -0,0 +1,48 @@
+"""
+Request-scoped database session middleware
+Finalizes the single AsyncSession lazily attached to a request by get_db
+"""
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.requests import Request
+from starlette.responses import Response
+
+from app.db.database import release_db_slot
+
+
+class DBSessionMiddleware(BaseHTTPMiddleware):
+    """
+    Owns the lifecycle of the per-request session.
+
+    No session is opened here - get_db creates one on first use and stores it
+    on request.state.db. Once the endpoint has produced a response the session
+    is committed (or rolled back on error) and closed, and its admission
+    slot is handed back. Read-only (autocommit) sessions are just closed.
+    """
+
+    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+        request.state.db = None
+        request.state.db_readonly = False
+
+        try:
+            response = await call_next(request)
+
+            session = request.state.db
+            if session is not None and not request.state.db_readonly:
+                if response.status_code < 400:
+                    await session.commit()
+                else:
+                    await session.rollback()
+
+            return response
+        except Exception:
+            session = request.state.db
+            if session is not None:
+                await session.rollback()
+            raise
+        finally:
+            session = request.state.db
+            if session is not None:
+                try:
+                    await session.close()
+                finally:
+                    release_db_slot()
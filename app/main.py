@@ -1,17 +1,40 @@
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Depends
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio.session import AsyncSession
 from app.api.v1 import api_v1_router
 from app.core.logger import info
-from app.db import get_db
+from app.db import database, get_db_readonly, DBSessionMiddleware
+from app.repositories.job_repository import JobRepository
+from app.services.job_service import JobService
 from app.core import settings
 from sqlalchemy import text
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.setup_logger import api_logger
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Build per-process singletons once the worker process has started
+    and release the connection pool on shutdown
+    """
+    await database.init_database()
+    app.state.job_repository = JobRepository()
+    app.state.job_service = JobService(app.state.job_repository)
+
+    yield
+
+    await database.close_database()
+
+
 app = FastAPI(
     title=settings.PROJECT_NAME,
     version=settings.VERSION,
+    lifespan=lifespan,
+    # orjson for every JSON response unless a route picks its own class
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(
@@ -22,6 +45,9 @@ app.add_middleware(
     allow_headers=["*"],  # Allows all headers
 )
 
+# One lazily created DB session per request, finalized after the endpoint runs
+app.add_middleware(DBSessionMiddleware)
+
 app.include_router(api_v1_router, prefix=settings.API_V1_STR)
 
 info(api_logger, "FastAPI application starting...")
@@ -31,7 +57,7 @@ def health_check():
     return {"status": "ok", "message": "Application running"}
 
 @app.get("/db-health")
-async def db_health_check(db: AsyncSession = Depends(get_db)):
+async def db_health_check(db: AsyncSession = Depends(get_db_readonly)):
     try:
         result = await db.execute(text('SELECT 1'))
         _ = result.scalar()
@@ -1,5 +1,4 @@
-from datetime import datetime, timezone
-from sqlalchemy import Column, DateTime, Integer, Boolean
+from sqlalchemy import Column, DateTime, Integer, Boolean, func
 from app.db import Base
 
 
@@ -9,17 +8,19 @@ class BaseModel(Base):
     # Primary key
     id = Column(Integer, primary_key=True, index=True)
 
+    # Timestamps come from the database clock, like every other job time
+    # comparison (claims, stale resets); also filled in for COPY loads
     created_at = Column(
         DateTime(timezone=True),
         nullable=False,
-        default=lambda: datetime.now(timezone.utc)
+        server_default=func.now()
     )
 
     updated_at = Column(
         DateTime(timezone=True),
         nullable=False,
-        default=lambda: datetime.now(timezone.utc),
-        onupdate=lambda: datetime.now(timezone.utc)  # Auto-update on changes
+        server_default=func.now(),
+        onupdate=func.now()  # Auto-update on changes
     )
 
     is_deleted = Column(Boolean, default=False, nullable=False)
@@ -1,5 +1,6 @@
+from sqlalchemy import text
 from sqlalchemy.sql.functions import func
-from sqlalchemy.sql.schema import Column
+from sqlalchemy.sql.schema import Column, Index
 from sqlalchemy.sql.sqltypes import String, DateTime, Integer, JSON
 
 from app.models.base_model import BaseModel
@@ -7,6 +8,22 @@ from app.models.base_model import BaseModel
 
 class Jobs(BaseModel):
     __tablename__ = "jobs"
+    __table_args__ = (
+        # Worker claim path: live pending jobs of a queue in (scheduled_at, id) order
+        Index(
+            "ix_jobs_claim",
+            "queue_name", "scheduled_at", "id",
+            postgresql_where=text("status = 'pending' AND is_deleted = false"),
+        ),
+        # reset_stale_jobs: live running jobs by last update
+        Index(
+            "ix_jobs_running_stale",
+            "updated_at",
+            postgresql_where=text("status = 'running' AND is_deleted = false"),
+        ),
+        # cleanup_completed_jobs and other status + age scans
+        Index("ix_jobs_status_updated", "status", "updated_at"),
+    )
 
     #core
     queue_name = Column(String(100), nullable=False, default="default", index=True)
@@ -16,9 +33,9 @@ class Jobs(BaseModel):
     payload = Column(JSON, nullable=False, default=dict)
 
     # Job status and scheduling
-    status = Column(String(20), nullable=False, default="pending", index=True)
+    status = Column(String(20), nullable=False, default="pending")
     scheduled_at = Column(DateTime(timezone=True), nullable=False,
-                          default=func.now(), index=True)
+                          server_default=func.now())
 
     # Retry logic
     attempts = Column(Integer, nullable=False, default=0, index=True)
@@ -1,8 +1,9 @@
-from typing import Generic, TypeVar, Type, List, Optional, Any, Dict
-from datetime import datetime, timezone
+from typing import Generic, TypeVar, Type, List, Optional, Any, Dict, AsyncIterator
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, func, and_
+from sqlalchemy import select, insert, update, func, and_
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import raiseload
+from app.core import settings
 from app.db import Base
 
 ModelType = TypeVar("ModelType", bound=Base)
@@ -10,42 +11,59 @@ ModelType = TypeVar("ModelType", bound=Base)
 class AsyncBaseRepository(Generic[ModelType]):
     def __init__(self, model: Type[ModelType]):
         self.model = model
+        # Column names resolved once; replaces per-call hasattr probes
+        self._columns = frozenset(model.__table__.columns.keys())
+        self._has_is_deleted = 'is_deleted' in self._columns
+        self._has_updated_at = 'updated_at' in self._columns
+
+        # Base SELECTs built once; statements are immutable, so callers extend copies
+        self._select_all = select(model)
+        if settings.STRICT_RELATIONSHIPS:
+            # Relationships must be eager-loaded explicitly (e.g. selectinload)
+            self._select_all = self._select_all.options(raiseload('*'))
+        self._select_live = (
+            self._select_all.where(model.is_deleted == False)
+            if self._has_is_deleted else self._select_all
+        )
 
     def _get_base_query(self, include_deleted: bool = False):
         """
         Get base select statement with soft delete filter.
         """
-        stmt = select(self.model)
-        if not include_deleted and hasattr(self.model, 'is_deleted'):
-            stmt = stmt.where(self.model.is_deleted == False)
-        return stmt
+        return self._select_all if include_deleted else self._select_live
 
     async def create(self, db: AsyncSession, *, obj_in: Dict[str, Any]) -> ModelType:
         """
         Create a new record.
         """
         try:
-            db_obj = self.model(**obj_in)
-            db.add(db_obj)
-            await db.flush()  # Get ID without committing transaction
-            await db.refresh(db_obj)
-            return db_obj
+            # INSERT ... RETURNING: id and defaults come back in the same round trip
+            stmt = insert(self.model).values(**obj_in).returning(self.model)
+            return (await db.scalars(stmt)).one()
         except SQLAlchemyError as e:
             await db.rollback()
             raise
 
-    async def create_many(self, db: AsyncSession, *, objs_in: List[Dict[str, Any]]) -> List[ModelType]:
+    async def create_many(
+            self,
+            db: AsyncSession,
+            *,
+            objs_in: List[Dict[str, Any]],
+            page_size: Optional[int] = None
+    ) -> List[ModelType]:
         """
         Create multiple new records.
+
+        page_size caps the rows per multi-row VALUES batch that SQLAlchemy's
+        insertmanyvalues sends for the single execute call.
         """
         try:
-            db_objs = [self.model(**obj_in) for obj_in in objs_in]
-            db.add_all(db_objs)
-            await db.flush()
-            # Refresh all objects to get their IDs
-            for db_obj in db_objs:
-                await db.refresh(db_obj)
-            return db_objs
+            # One INSERT ... RETURNING for the whole batch, rows back in input order
+            stmt = insert(self.model).returning(self.model, sort_by_parameter_order=True)
+            if page_size:
+                stmt = stmt.execution_options(insertmanyvalues_page_size=page_size)
+            result = await db.scalars(stmt, objs_in)
+            return list(result.all())
         except SQLAlchemyError as e:
             await db.rollback()
             raise
@@ -66,50 +84,135 @@ class AsyncBaseRepository(Generic[ModelType]):
         result = await db.execute(stmt)
         return list(result.scalars().all())
 
-    async def get_paginated(
+    async def _stream(self, db: AsyncSession, stmt, chunk_size: int = 500) -> AsyncIterator[ModelType]:
+        """
+        Yield ORM objects from a server-side cursor, chunk_size rows at a time.
+
+        asyncpg only opens server-side cursors inside a transaction, so db must
+        be a transactional session (get_db / SessionLocal), not the AUTOCOMMIT
+        one from get_db_readonly.
+        """
+        connection = await db.connection()
+        if connection.sync_connection.get_execution_options().get("isolation_level") == "AUTOCOMMIT":
+            raise RuntimeError(
+                "Streaming needs a transactional session; server-side cursors "
+                "can't be used on an AUTOCOMMIT (read-only) session"
+            )
+
+        result = await db.stream_scalars(stmt.execution_options(yield_per=chunk_size))
+        async for obj in result:
+            yield obj
+
+    def iter_all(
             self,
             db: AsyncSession,
-            skip: int = 0,
-            limit: int = 100,
-            include_deleted: bool = False
-    ) -> List[ModelType]:
+            include_deleted: bool = False,
+            chunk_size: int = 1000
+    ) -> AsyncIterator[ModelType]:
         """
-        Get paginated records.
+        Stream all records ordered by id without materializing a list.
+        Needs a transactional session (see _stream).
         """
-        stmt = self._get_base_query(include_deleted).offset(skip).limit(limit)
-        result = await db.execute(stmt)
-        return list(result.scalars().all())
+        stmt = self._get_base_query(include_deleted).order_by(self.model.id)
+        return self._stream(db, stmt, chunk_size)
 
-    async def get_by_condition(
+    async def get_paginated(
             self,
             db: AsyncSession,
-            condition: Dict[str, Any],
+            skip: int = 0,
+            limit: int = 100,
             include_deleted: bool = False,
-            limit: Optional[int] = None
+            after_id: Optional[Any] = None,
+            condition: Optional[Dict[str, Any]] = None
     ) -> List[ModelType]:
         """
-        Get records based on conditions.
+        Get paginated records ordered by id, optionally filtered by a
+        {column: value} condition dict.
+
+        Pass the last id of the previous page as after_id for keyset
+        pagination (an index range scan) instead of OFFSET, which has to
+        walk and discard every skipped row.
         """
-        stmt = self._get_base_query(include_deleted)
+        stmt = self._get_base_query(include_deleted).order_by(self.model.id)
+        if condition:
+            stmt = self._apply_condition(stmt, condition)
+        if after_id is not None:
+            stmt = stmt.where(self.model.id > after_id)
+        elif skip:
+            stmt = stmt.offset(skip)
+
+        result = await db.execute(stmt.limit(limit))
+        return list(result.scalars().all())
 
+    def _apply_condition(self, stmt, condition: Dict[str, Any]):
+        """
+        Add the WHERE clauses for a {column: value} condition dict.
+        """
         # Build WHERE conditions
         where_conditions = []
         for attr, value in condition.items():
-            if hasattr(self.model, attr):
-                if isinstance(value, list):
-                    where_conditions.append(getattr(self.model, attr).in_(value))
+            if attr in self._columns:
+                column = getattr(self.model, attr)
+                # A one-element list is a plain equality; the planner estimates it better than IN
+                if isinstance(value, list) and len(value) != 1:
+                    where_conditions.append(column.in_(value))
+                elif isinstance(value, list):
+                    where_conditions.append(column == value[0])
                 else:
-                    where_conditions.append(getattr(self.model, attr) == value)
+                    where_conditions.append(column == value)
 
-        if where_conditions:
+        if len(where_conditions) == 1:
+            stmt = stmt.where(where_conditions[0])
+        elif where_conditions:
             stmt = stmt.where(and_(*where_conditions))
 
+        return stmt
+
+    def _condition_query(
+            self,
+            condition: Dict[str, Any],
+            include_deleted: bool = False,
+            limit: Optional[int] = None
+    ):
+        """
+        Build the SELECT for a {column: value} condition dict.
+        """
+        stmt = self._apply_condition(self._get_base_query(include_deleted), condition)
+
         if limit:
             stmt = stmt.limit(limit)
 
+        return stmt
+
+    async def get_by_condition(
+            self,
+            db: AsyncSession,
+            condition: Dict[str, Any],
+            include_deleted: bool = False,
+            limit: Optional[int] = None
+    ) -> List[ModelType]:
+        """
+        Get records based on conditions.
+        """
+        stmt = self._condition_query(condition, include_deleted, limit)
         result = await db.execute(stmt)
         return list(result.scalars().all())
 
+    def stream_by_condition(
+            self,
+            db: AsyncSession,
+            condition: Dict[str, Any],
+            include_deleted: bool = False,
+            limit: Optional[int] = None,
+            chunk_size: int = 500
+    ) -> AsyncIterator[ModelType]:
+        """
+        Like get_by_condition, but yields records for callers that iterate once.
+        Needs a transactional session (see _stream).
+        """
+        stmt = self._condition_query(condition, include_deleted, limit)
+        return self._stream(db, stmt, chunk_size)
+
     async def get_one_by_condition(
             self,
             db: AsyncSession,
@@ -132,25 +235,30 @@ class AsyncBaseRepository(Generic[ModelType]):
     ) -> Optional[ModelType]:
         """
         Update a record by id.
+
+        Single UPDATE ... RETURNING; the record is not loaded first.
         """
         try:
-            db_obj = await self.get(db, id, include_deleted)
-            if not db_obj:
-                return None
-
-            # Update fields
-            for key, value in obj_in.items():
-                if hasattr(db_obj, key):
-                    setattr(db_obj, key, value)
+            values = {key: value for key, value in obj_in.items() if key in self._columns}
 
             # Update timestamp if exists
-            if hasattr(db_obj, 'updated_at'):
-                setattr(db_obj, 'updated_at', datetime.now(timezone.utc))
+            if self._has_updated_at:
+                values['updated_at'] = func.now()
 
-            db.add(db_obj)
-            await db.flush()
-            await db.refresh(db_obj)
-            return db_obj
+            if not values:
+                return await self.get(db, id, include_deleted)
+
+            stmt = update(self.model).where(self.model.id == id)
+            if not include_deleted and self._has_is_deleted:
+                stmt = stmt.where(self.model.is_deleted == False)
+
+            stmt = (
+                stmt.values(**values)
+                .returning(self.model)
+                .execution_options(synchronize_session=False, populate_existing=True)
+            )
+            result = await db.execute(stmt)
+            return result.scalar_one_or_none()
         except SQLAlchemyError as e:
             await db.rollback()
             raise
@@ -165,25 +273,30 @@ class AsyncBaseRepository(Generic[ModelType]):
     ) -> List[ModelType]:
         """
         Update multiple records by ids.
+
+        Single UPDATE ... RETURNING, like update().
         """
         try:
-            stmt = self._get_base_query(include_deleted).where(self.model.id.in_(ids))
-            result = await db.execute(stmt)
-            db_objs = list(result.scalars().all())
-
-            for db_obj in db_objs:
-                for key, value in obj_in.items():
-                    if hasattr(db_obj, key):
-                        setattr(db_obj, key, value)
+            values = {key: value for key, value in obj_in.items() if key in self._columns}
 
-                # Update timestamp if exists
-                if hasattr(db_obj, 'updated_at'):
-                    setattr(db_obj, 'updated_at', datetime.now(timezone.utc))
-
-                db.add(db_obj)
-
-            await db.flush()
-            return db_objs
+            # Update timestamp if exists
+            if self._has_updated_at:
+                values['updated_at'] = func.now()
+
+            if not values:
+                stmt = self._get_base_query(include_deleted).where(self.model.id.in_(ids))
+                return list((await db.scalars(stmt)).all())
+
+            stmt = update(self.model).where(self.model.id.in_(ids))
+            if not include_deleted and self._has_is_deleted:
+                stmt = stmt.where(self.model.is_deleted == False)
+
+            stmt = (
+                stmt.values(**values)
+                .returning(self.model)
+                .execution_options(synchronize_session=False, populate_existing=True)
+            )
+            return list((await db.scalars(stmt)).all())
         except SQLAlchemyError as e:
             await db.rollback()
             raise
@@ -199,15 +312,15 @@ class AsyncBaseRepository(Generic[ModelType]):
         """
         try:
             # Add updated_at if model has it
-            if hasattr(self.model, 'updated_at'):
-                values['updated_at'] = datetime.now(timezone.utc)
+            if self._has_updated_at:
+                values['updated_at'] = func.now()
 
             stmt = update(self.model)
 
             # Build WHERE conditions
             where_conditions = []
             for attr, value in condition.items():
-                if hasattr(self.model, attr):
+                if attr in self._columns:
                     where_conditions.append(getattr(self.model, attr) == value)
 
             if where_conditions:
@@ -297,14 +410,14 @@ class AsyncBaseRepository(Generic[ModelType]):
         stmt = select(func.count(self.model.id))
 
         # Add soft delete filter
-        if not include_deleted and hasattr(self.model, 'is_deleted'):
+        if not include_deleted and self._has_is_deleted:
             stmt = stmt.where(self.model.is_deleted == False)
 
         # Add conditions
         if condition:
             where_conditions = []
             for attr, value in condition.items():
-                if hasattr(self.model, attr):
+                if attr in self._columns:
                     where_conditions.append(getattr(self.model, attr) == value)
             if where_conditions:
                 stmt = stmt.where(and_(*where_conditions))
@@ -333,7 +446,7 @@ class AsyncBaseRepository(Generic[ModelType]):
         """
         Get only deleted records.
         """
-        if not hasattr(self.model, 'is_deleted'):
+        if not self._has_is_deleted:
             return []
 
         stmt = select(self.model).where(self.model.is_deleted == True)
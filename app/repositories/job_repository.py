@@ -1,7 +1,9 @@
-from typing import List, Optional, Dict, Any
-from datetime import datetime, timezone, timedelta
+from typing import List, Optional, Dict, Any, Tuple
+from datetime import datetime, timedelta
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, and_, text
+import orjson
+from sqlalchemy import select, update, delete, func, any_, text, bindparam, cast, case, column, literal, literal_column, values, Integer, Interval, String, JSON
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from sqlalchemy.exc import SQLAlchemyError
 
 from app.constants.job_types import JobTypes
@@ -11,6 +13,109 @@ from app.models.jobs_model import Jobs
 from app.schemas.job_schemas import get_valid_statuses
 
 
+# Rows per multi-row VALUES page; keeps bind parameters well under PostgreSQL's 65535 limit
+BULK_INSERT_CHUNK_SIZE = 500
+
+# Defaults for jobs whose payload has no value yet
+EMPTY_OBJECT = literal_column("'{}'::jsonb")
+EMPTY_ARRAY = literal_column("'[]'::jsonb")
+
+# Rows removed per DELETE (and per transaction) by cleanup_completed_jobs
+CLEANUP_BATCH_SIZE = 1000
+
+# Batches at least this large are loaded with COPY instead of INSERT
+BULK_COPY_THRESHOLD = 100
+
+# Column order of the records streamed by bulk_enqueue_copy;
+# created_at/updated_at are left to the columns' now() defaults
+COPY_COLUMNS = (
+    "id", "job_type", "payload", "queue_name", "status", "scheduled_at",
+    "attempts", "max_tries", "is_deleted",
+)
+
+# Statements below are built once at import and executed with bind parameters,
+# so hot paths skip statement construction and hit SQLAlchemy's compiled cache.
+
+# Wakes workers LISTENing on the given channels; delivered when the transaction commits
+NOTIFY_CHANNELS = text(
+    "SELECT pg_notify(channel, '') FROM unnest(CAST(:channels AS text[])) AS channel"
+)
+
+# now() is the transaction start time: the same value the column defaults will use
+RESERVE_JOB_IDS = text(
+    "SELECT nextval(pg_get_serial_sequence('jobs', 'id')), now() FROM generate_series(1, :n)"
+)
+
+# Oldest due pending jobs; rows locked by other workers are skipped.
+# Queues are bound as one text[] (= ANY) rather than an expanded IN list, so the
+# SQL text is the same for any number of queues and asyncpg reuses one prepared statement.
+_claimable_ids = (
+    select(Jobs.id)
+    .where(
+        Jobs.status == QueueStatus.pending,
+        Jobs.queue_name == any_(bindparam("queue_names", type_=ARRAY(String))),
+        Jobs.scheduled_at <= func.now(),
+        Jobs.is_deleted == False
+    )
+    .order_by(Jobs.scheduled_at, Jobs.id)
+    .limit(bindparam("batch_size"))
+    .with_for_update(skip_locked=True)
+    .cte("claimable")
+)
+
+# UPDATE ... FROM the CTE, so the LIMIT subquery is evaluated once
+CLAIM_JOBS = (
+    update(Jobs)
+    .where(Jobs.id == _claimable_ids.c.id)
+    .values(
+        status=QueueStatus.running,
+        attempts=Jobs.attempts + 1,
+        updated_at=func.now()
+    )
+    .returning(Jobs)
+    .execution_options(synchronize_session=False, populate_existing=True)
+)
+
+# One bounded slice of completed jobs older than :age, served by ix_jobs_status_updated;
+# rows another transaction holds are left for the next batch
+_expired_completed_ids = (
+    select(Jobs.id)
+    .where(
+        Jobs.status == QueueStatus.completed,
+        Jobs.updated_at < func.now() - bindparam("age", type_=Interval)
+    )
+    .limit(bindparam("batch_size"))
+    .with_for_update(skip_locked=True)
+)
+
+DELETE_COMPLETED_BATCH = (
+    delete(Jobs)
+    .where(Jobs.id.in_(_expired_completed_ids.scalar_subquery()))
+    .execution_options(synchronize_session=False)
+)
+
+JOB_STATS = (
+    select(Jobs.status, Jobs.queue_name, func.count().label("count"))
+    .where(Jobs.is_deleted == False)
+    .group_by(Jobs.status, Jobs.queue_name)
+)
+
+
+# Channel names are identifiers, so PostgreSQL caps them at 63 bytes
+JOB_CHANNEL_PREFIX = "jobs_new_"
+MAX_CHANNEL_BYTES = 63
+
+
+def job_channel(queue_name: str) -> str:
+    """
+    NOTIFY/LISTEN channel announcing new jobs in queue_name.
+
+    Overlong names are truncated; a collision only causes a spurious wakeup.
+    """
+    channel = (JOB_CHANNEL_PREFIX + queue_name).encode()[:MAX_CHANNEL_BYTES]
+    return channel.decode(errors="ignore")
+
+
 class JobRepository(AsyncBaseRepository[Jobs]):
     def __init__(self):
         super().__init__(Jobs)
@@ -27,21 +132,127 @@ class JobRepository(AsyncBaseRepository[Jobs]):
     ) -> Jobs:
         """
         Enqueue a new job.
-        """
-        if scheduled_at is None:
-            scheduled_at = datetime.now(timezone.utc)
 
+        Without scheduled_at the job is due at the database's now().
+        """
         job_data = {
             "job_type": job_type.value,
             "payload": payload,
             "queue_name": queue_name,
-            "status": QueueStatus.pending.value,
-            "scheduled_at": scheduled_at,
+            "status": QueueStatus.pending,
             "attempts": 0,
             "max_tries": max_tries
         }
+        if scheduled_at is not None:
+            job_data["scheduled_at"] = scheduled_at
+
+        job = await self.create(db, obj_in=job_data)
+        await self.notify_new_jobs(db, [queue_name])
+        return job
+
+    async def enqueue_jobs_bulk(
+            self,
+            db: AsyncSession,
+            jobs: List[Dict[str, Any]],
+            chunk_size: int = BULK_INSERT_CHUNK_SIZE
+    ) -> List[Jobs]:
+        """
+        Enqueue many jobs with a single executemany INSERT ... RETURNING
+        (sent as multi-row VALUES pages of chunk_size rows), or a single
+        COPY once the batch reaches BULK_COPY_THRESHOLD.
+
+        Each item takes the same keys as enqueue_job's keyword arguments.
+        """
+        try:
+            rows = []
+            for job in jobs:
+                row = {
+                    "job_type": job["job_type"].value,
+                    "payload": job["payload"],
+                    "queue_name": job.get("queue_name") or "default",
+                    "status": QueueStatus.pending,
+                    "attempts": 0,
+                    "max_tries": job.get("max_tries", 3)
+                }
+                # Unscheduled jobs are due at the database's now()
+                if job.get("scheduled_at"):
+                    row["scheduled_at"] = job["scheduled_at"]
+                rows.append(row)
+
+            if len(rows) >= BULK_COPY_THRESHOLD:
+                created = await self.bulk_enqueue_copy(db, rows)
+            else:
+                created = await self.create_many(db, objs_in=rows, page_size=chunk_size)
+
+            await self.notify_new_jobs(db, {row["queue_name"] for row in rows})
+            return created
+        except SQLAlchemyError as e:
+            await db.rollback()
+            raise
+
+    async def bulk_enqueue_copy(
+            self,
+            db: AsyncSession,
+            rows: List[Dict[str, Any]]
+    ) -> List[Jobs]:
+        """
+        Load job rows with PostgreSQL COPY inside the session's transaction.
+
+        Ids are reserved from the table's sequence up front so the created
+        jobs can be returned without reading them back. The returned Jobs
+        are transient (not attached to the session).
+        """
+        try:
+            reserved = (await db.execute(RESERVE_JOB_IDS, {"n": len(rows)})).all()
+            ids = [job_id for job_id, _ in reserved]
+            # COPY can't fall back to a default per row, so unscheduled jobs get
+            # the transaction's now() explicitly; timestamps use the same value
+            now = reserved[0][1]
+
+            jobs = [
+                Jobs(
+                    id=job_id, created_at=now, updated_at=now, is_deleted=False,
+                    **{"scheduled_at": now, **row}
+                )
+                for job_id, row in zip(ids, rows)
+            ]
+            records = [
+                (
+                    job.id,
+                    job.job_type,
+                    orjson.dumps(job.payload).decode(),
+                    job.queue_name,
+                    QueueStatus.pending.value,
+                    job.scheduled_at,
+                    job.attempts,
+                    job.max_tries,
+                    False,
+                )
+                for job in jobs
+            ]
+
+            connection = await db.connection()
+            raw_connection = await connection.get_raw_connection()
+            await raw_connection.driver_connection.copy_records_to_table(
+                Jobs.__tablename__,
+                records=records,
+                columns=COPY_COLUMNS
+            )
+            return jobs
+        except SQLAlchemyError as e:
+            await db.rollback()
+            raise
 
-        return await self.create(db, obj_in=job_data)
+    async def notify_new_jobs(self, db: AsyncSession, queue_names) -> None:
+        """
+        NOTIFY workers listening on these queues that jobs are available.
+
+        Sent inside the caller's transaction, so listeners only hear about
+        it once the jobs are committed (and never if it rolls back).
+        """
+        channels = sorted({job_channel(queue_name) for queue_name in queue_names})
+        if channels:
+            await db.execute(NOTIFY_CHANNELS, {"channels": channels})
 
     async def claim_next_job(
             self,
@@ -53,46 +264,33 @@ class JobRepository(AsyncBaseRepository[Jobs]):
         Claim the next available job using FOR UPDATE SKIP LOCKED.
         This ensures atomic job claiming without conflicts.
         """
+        jobs = await self.claim_next_jobs(db, queue_names, worker_id, batch_size=1)
+        return jobs[0] if jobs else None
+
+    async def claim_next_jobs(
+            self,
+            db: AsyncSession,
+            queue_names: List[str] = None,
+            worker_id: str = None,
+            batch_size: int = 10
+    ) -> List[Jobs]:
+        """
+        Claim up to batch_size available jobs in one round trip.
+
+        Due pending jobs are locked with FOR UPDATE SKIP LOCKED and flipped
+        to running by the same UPDATE ... RETURNING, so concurrent workers
+        never receive the same job. Jobs come back oldest first.
+        """
         try:
             if queue_names is None:
                 queue_names = ["default"]
 
-            # Build the query with FOR UPDATE SKIP LOCKED
-            query = text("""
-                UPDATE jobs 
-                SET status = :running_status, 
-                    attempts = attempts + 1,
-                    updated_at = :updated_at
-                WHERE id = (
-                    SELECT id FROM jobs 
-                    WHERE status = :pending_status
-                    AND queue_name = ANY(:queue_names)
-                    AND scheduled_at <= :now
-                    AND (is_deleted = false OR is_deleted IS NULL)
-                    ORDER BY scheduled_at ASC, id ASC
-                    FOR UPDATE SKIP LOCKED
-                    LIMIT 1
-                )
-                RETURNING *;
-            """)
-
-            result = await db.execute(query, {
-                "pending_status": QueueStatus.pending.value,
-                "running_status": QueueStatus.running.value,
+            jobs = await db.scalars(CLAIM_JOBS, {
                 "queue_names": queue_names,
-                "now": datetime.now(timezone.utc),
-                "updated_at": datetime.now(timezone.utc)
+                "batch_size": batch_size
             })
-
-            row = result.fetchone()
-            if row:
-                # Convert row to Jobs object
-                job = Jobs()
-                for key, value in row._mapping.items():
-                    setattr(job, key, value)
-                return job
-
-            return None
+            # RETURNING order is unspecified; restore queue order
+            return sorted(jobs, key=lambda job: (job.scheduled_at, job.id))
 
         except SQLAlchemyError as e:
             await db.rollback()
@@ -106,20 +304,88 @@ class JobRepository(AsyncBaseRepository[Jobs]):
     ) -> Optional[Jobs]:
         """
         Mark a job as completed.
+
+        Single UPDATE; result_data is merged into the payload server-side.
         """
-        update_data = {
-            "status": QueueStatus.completed.value,
-            "updated_at": datetime.now(timezone.utc)
-        }
+        try:
+            values = {
+                "status": QueueStatus.completed,
+                "updated_at": func.now()
+            }
+
+            # Optionally store result data in payload
+            if result_data:
+                values["payload"] = cast(
+                    func.jsonb_set(
+                        func.coalesce(cast(Jobs.payload, JSONB), EMPTY_OBJECT),
+                        literal_column("'{result}'"),
+                        literal(result_data, JSONB)
+                    ),
+                    JSON
+                )
+
+            stmt = (
+                update(Jobs)
+                .where(Jobs.id == job_id, Jobs.is_deleted == False)
+                .values(**values)
+                .returning(Jobs)
+                .execution_options(synchronize_session=False, populate_existing=True)
+            )
+            return (await db.scalars(stmt)).one_or_none()
+        except SQLAlchemyError as e:
+            await db.rollback()
+            raise
+
+    async def mark_jobs_completed(
+            self,
+            db: AsyncSession,
+            completions: List[Tuple[int, Optional[Dict[str, Any]]]]
+    ) -> int:
+        """
+        Mark many jobs as completed with one UPDATE ... FROM (VALUES ...).
+
+        Each item is (job_id, result_data); a non-empty result_data is
+        merged into that job's payload["result"] like mark_job_completed.
 
-        # Optionally store result data in payload
-        if result_data:
-            job = await self.get(db, job_id)
-            if job and job.payload:
-                job.payload.update({"result": result_data})
-                update_data["payload"] = job.payload
+        Returns:
+            Number of jobs updated
+        """
+        if not completions:
+            return 0
 
-        return await self.update(db, id=job_id, obj_in=update_data)
+        try:
+            completed = values(
+                column("id", Integer),
+                column("result", JSONB(none_as_null=True)),
+                name="completed"
+            ).data([(job_id, result_data or None) for job_id, result_data in completions])
+
+            # A VALUES column of bare NULLs (no job returned a result) is typed
+            # text by PostgreSQL, so give it its type explicitly
+            result = cast(completed.c.result, JSONB)
+            payload_with_result = cast(
+                func.jsonb_set(
+                    func.coalesce(cast(Jobs.payload, JSONB), EMPTY_OBJECT),
+                    literal_column("'{result}'"),
+                    result
+                ),
+                JSON
+            )
+
+            stmt = (
+                update(Jobs)
+                .where(Jobs.id == completed.c.id, Jobs.is_deleted == False)
+                .values(
+                    status=QueueStatus.completed,
+                    updated_at=func.now(),
+                    payload=case((result.is_(None), Jobs.payload), else_=payload_with_result)
+                )
+                .execution_options(synchronize_session=False)
+            )
+            return (await db.execute(stmt)).rowcount
+        except SQLAlchemyError as e:
+            await db.rollback()
+            raise
 
     async def mark_job_failed(
             self,
@@ -130,41 +396,85 @@ class JobRepository(AsyncBaseRepository[Jobs]):
     ) -> Optional[Jobs]:
         """
         Mark a job as failed and potentially retry it.
-        """
-        job = await self.get(db, job_id)
-        if not job:
-            return None
 
-        # Check if we should retry
-        should_retry = retry and job.attempts < job.max_tries
-
-        update_data = {
-            "status": QueueStatus.pending.value if should_retry else QueueStatus.failed.value,
-            "updated_at": datetime.now(timezone.utc)
-        }
-
-        # Add error info to payload
-        if job.payload:
-            if "errors" not in job.payload:
-                job.payload["errors"] = []
-            job.payload["errors"].append({
-                "attempt": job.attempts,
-                "error": error_message,
-                "timestamp": datetime.now(timezone.utc).isoformat()
-            })
-            update_data["payload"] = job.payload
+        Single UPDATE: the retry decision, the exponential backoff
+        (1, 2, 4, 8 minutes...) and the appended error entry are all
+        computed from the row's current values and the database clock.
+        """
+        try:
+            # Add error info to payload["errors"]
+            error_entry = literal({"error": error_message}, JSONB).op("||")(
+                func.jsonb_build_object(
+                    literal_column("'attempt'"), Jobs.attempts,
+                    literal_column("'timestamp'"), func.now()
+                )
+            )
+            payload = func.coalesce(cast(Jobs.payload, JSONB), EMPTY_OBJECT)
+            errors = func.coalesce(payload["errors"], EMPTY_ARRAY).op("||")(func.jsonb_build_array(error_entry))
+
+            values = {
+                "status": QueueStatus.failed,
+                "updated_at": func.now(),
+                "payload": cast(func.jsonb_set(payload, literal_column("'{errors}'"), errors), JSON)
+            }
+
+            # If retrying, schedule for later (exponential backoff)
+            if retry:
+                should_retry = Jobs.attempts < Jobs.max_tries
+                backoff = func.make_interval(0, 0, 0, 0, 0, cast(func.power(2, Jobs.attempts - 1), Integer))
+                values["status"] = case((should_retry, QueueStatus.pending.value), else_=QueueStatus.failed.value)
+                values["scheduled_at"] = case((should_retry, func.now() + backoff), else_=Jobs.scheduled_at)
+
+            stmt = (
+                update(Jobs)
+                .where(Jobs.id == job_id, Jobs.is_deleted == False)
+                .values(**values)
+                .returning(Jobs)
+                .execution_options(synchronize_session=False, populate_existing=True)
+            )
+            return (await db.scalars(stmt)).one_or_none()
+        except SQLAlchemyError as e:
+            await db.rollback()
+            raise
 
-        # If retrying, schedule for later (exponential backoff)
-        if should_retry:
-            delay_minutes = 2 ** (job.attempts - 1)  # 1, 2, 4, 8 minutes...
-            update_data["scheduled_at"] = datetime.now(timezone.utc) + timedelta(minutes=delay_minutes)
+    async def cancel_if_pending(
+            self,
+            db: AsyncSession,
+            job_id: int
+    ) -> Optional[Jobs]:
+        """
+        Cancel and soft delete a job in one UPDATE, only if it is still pending.
 
-        return await self.update(db, id=job_id, obj_in=update_data)
+        The status check lives in the WHERE clause, so a worker claiming
+        the job concurrently either wins or the cancel does - never both.
+        Returns None when the job is missing or not pending.
+        """
+        try:
+            stmt = (
+                update(Jobs)
+                .where(
+                    Jobs.id == job_id,
+                    Jobs.status == QueueStatus.pending,
+                    Jobs.is_deleted == False
+                )
+                .values(
+                    status=QueueStatus.cancelled,
+                    is_deleted=True,
+                    deleted_at=func.now(),
+                    updated_at=func.now()
+                )
+                .returning(Jobs)
+                .execution_options(synchronize_session=False, populate_existing=True)
+            )
+            return (await db.scalars(stmt)).one_or_none()
+        except SQLAlchemyError as e:
+            await db.rollback()
+            raise
 
     async def get_jobs_by_status(
             self,
             db: AsyncSession,
-            status: str,
+            status: QueueStatus,
             queue_name: Optional[str] = None,
             limit: int = 100
     ) -> List[Jobs]:
@@ -181,7 +491,7 @@ class JobRepository(AsyncBaseRepository[Jobs]):
             self,
             db: AsyncSession,
             queue_name: str,
-            status: Optional[str] = None,
+            status: Optional[QueueStatus] = None,
             limit: int = 100
     ) -> List[Jobs]:
         """
@@ -193,34 +503,6 @@ class JobRepository(AsyncBaseRepository[Jobs]):
 
         return await self.get_by_condition(db, condition, limit=limit)
 
-    async def get_pending_jobs_count(
-            self,
-            db: AsyncSession,
-            queue_name: Optional[str] = None
-    ) -> int:
-        """
-        Get count of pending jobs.
-        """
-        condition = {"status": QueueStatus.pending.value}
-        if queue_name:
-            condition["queue_name"] = queue_name
-
-        return await self.count(db, condition)
-
-    async def get_running_jobs_count(
-            self,
-            db: AsyncSession,
-            queue_name: Optional[str] = None
-    ) -> int:
-        """
-        Get count of running jobs.
-        """
-        condition = {"status": QueueStatus.running.value}
-        if queue_name:
-            condition["queue_name"] = queue_name
-
-        return await self.count(db, condition)
-
     async def reset_stale_jobs(
             self,
             db: AsyncSession,
@@ -231,26 +513,23 @@ class JobRepository(AsyncBaseRepository[Jobs]):
         This handles cases where workers crash or jobs hang.
         """
         try:
-            cutoff_time = datetime.now(timezone.utc) - timedelta(minutes=stale_timeout_minutes)
-
-            count = await self.bulk_update(
-                db,
-                condition={
-                    "status": QueueStatus.running.value,
-                },
-                values={
-                    "status": QueueStatus.pending.value,
-                    "scheduled_at": datetime.now(timezone.utc)
-                }
-            )
-
-            # Additional SQL to only reset jobs older than cutoff
-            stmt = update(Jobs).where(
-                and_(
-                    Jobs.status == QueueStatus.pending.value,  # Just updated to pending
-                    Jobs.updated_at < cutoff_time  # But were updated before cutoff
+            cutoff_time = func.now() - timedelta(minutes=stale_timeout_minutes)
+
+            # Served by the ix_jobs_running_stale partial index
+            stmt = (
+                update(Jobs)
+                .where(
+                    Jobs.status == QueueStatus.running,
+                    Jobs.updated_at < cutoff_time,
+                    Jobs.is_deleted == False
+                )
+                .values(
+                    status=QueueStatus.pending,
+                    scheduled_at=func.now(),
+                    updated_at=func.now()
                 )
-            ).values(status=QueueStatus.pending.value)
+                .execution_options(synchronize_session=False)
+            )
 
             result = await db.execute(stmt)
             return result.rowcount
@@ -259,57 +538,62 @@ class JobRepository(AsyncBaseRepository[Jobs]):
             await db.rollback()
             raise
 
-    async def get_job_stats(self, db: AsyncSession) -> Dict[str, Any]:
-        """
-        Get overall job queue statistics.
+    async def count_by_status_and_queue(self, db: AsyncSession) -> Dict[Tuple[str, str], int]:
         """
-        stats = {}
+        Count live jobs per (status, queue_name) with one grouped query.
 
-        # Count by status
-        for status in get_valid_statuses():
-            stats[f"{status}_count"] = await self.count(db, {"status": status})
-
-        # Count by queue
-        stmt = select(Jobs.queue_name, text("COUNT(*) as count")).group_by(Jobs.queue_name)
-        if hasattr(Jobs, 'is_deleted'):
-            stmt = stmt.where(Jobs.is_deleted == False)
+        Every stats and monitoring count is derived from this result.
+        """
+        result = await db.execute(JOB_STATS)
+        return {(status, queue_name): count for status, queue_name, count in result}
 
-        result = await db.execute(stmt)
+    @staticmethod
+    def summarize_counts(counts: Dict[Tuple[str, str], int]) -> Dict[str, Any]:
+        """
+        Pivot count_by_status_and_queue output into per-status and per-queue totals.
+        """
+        stats = {f"{status}_count": 0 for status in get_valid_statuses()}
+        queue_stats: Dict[str, int] = {}
+        for (status, queue_name), count in counts.items():
+            key = f"{status}_count"
+            stats[key] = stats.get(key, 0) + count
+            queue_stats[queue_name] = queue_stats.get(queue_name, 0) + count
 
-        queue_stats = {row[0]: row[1] for row in result}
         stats["queue_counts"] = queue_stats
-
         return stats
 
+    async def get_job_stats(self, db: AsyncSession) -> Dict[str, Any]:
+        """
+        Get overall job queue statistics.
+
+        One grouped query; per-status and per-queue totals are summed in Python.
+        """
+        return self.summarize_counts(await self.count_by_status_and_queue(db))
+
     async def cleanup_completed_jobs(
             self,
             db: AsyncSession,
-            older_than_days: int = 7
+            older_than_days: int = 7,
+            batch_size: int = CLEANUP_BATCH_SIZE
     ) -> int:
         """
         Clean up completed jobs older than specified days.
+
+        Deletes batch_size rows at a time and commits after each batch,
+        so locks and WAL per transaction stay bounded on large backlogs.
+        Unlike other repository methods this commits the session.
         """
         try:
-            cutoff_date = datetime.now(timezone.utc) - timedelta(days=older_than_days)
-
-            # Use hard delete for completed jobs
-            stmt = select(Jobs).where(
-                and_(
-                    Jobs.status == QueueStatus.completed.value,
-                    Jobs.updated_at < cutoff_date
-                )
-            )
-
-            result = await db.execute(stmt)
-            jobs_to_delete = list(result.scalars().all())
+            params = {"age": timedelta(days=older_than_days), "batch_size": batch_size}
 
-            count = 0
-            for job in jobs_to_delete:
-                await db.delete(job)
-                count += 1
+            total = 0
+            while True:
+                result = await db.execute(DELETE_COMPLETED_BATCH, params)
+                await db.commit()
 
-            await db.flush()
-            return count
+                total += result.rowcount
+                if result.rowcount < batch_size:
+                    return total
 
         except SQLAlchemyError as e:
             await db.rollback()
@@ -325,16 +609,19 @@ class JobRepository(AsyncBaseRepository[Jobs]):
         Manually retry a failed job.
         """
         job = await self.get(db, job_id)
-        if not job or job.status != QueueStatus.failed.value:
+        if not job or job.status != QueueStatus.failed:
             return None
 
         update_data = {
-            "status": QueueStatus.pending.value,
-            "scheduled_at": datetime.now(timezone.utc)
+            "status": QueueStatus.pending,
+            "scheduled_at": func.now()
         }
 
         if reset_attempts:
             update_data["attempts"] = 0
 
-        return await self.update(db, id=job_id, obj_in=update_data)
+        job = await self.update(db, id=job_id, obj_in=update_data)
+        if job:
+            await self.notify_new_jobs(db, [job.queue_name])
+        return job
 
@@ -1,6 +1,8 @@
 from .job_schemas import (
     JobCreate,
     JobResponse,
+    JobResponseList,
+    JobPage,
     JobUpdate,
     JobStats,
     BulkJobCreate,
@@ -13,6 +15,8 @@ from .job_schemas import (
 __all__ = [
     "JobCreate",
     "JobResponse",
+    "JobResponseList",
+    "JobPage",
     "JobUpdate",
     "JobStats",
     "BulkJobCreate",
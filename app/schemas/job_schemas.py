@@ -3,7 +3,7 @@ from typing import Dict, Any, Optional, List
 
 from app.constants.job_types import JobTypes
 from app.constants.queue_status import QueueStatus
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 class JobCreate(BaseModel):
     """Schema for Job Creation"""
@@ -22,13 +22,28 @@ class JobResponse(BaseModel):
     job_type: JobTypes
     payload: Dict[str, Any]
     queue_name: str
-    status: str
+    status: QueueStatus
     scheduled_at: datetime
     attempts: int
     max_tries: int
     created_at: datetime
     updated_at: Optional[datetime] = None
 
+    @classmethod
+    def from_row(cls, row: Any) -> "JobResponse":
+        """Build from a Jobs row without validation; the data was validated on the way in."""
+        return cls.model_construct(**{name: getattr(row, name) for name in cls.model_fields})
+
+
+# Built once: serializes a whole result set in a single pydantic-core call
+JobResponseList = TypeAdapter(List[JobResponse])
+
+
+class JobPage(BaseModel):
+    """Schema for one keyset-paginated page of jobs."""
+    items: List[JobResponse]
+    next_cursor: Optional[int] = Field(None, description="Pass as after_id to fetch the next page")
+
 
 class JobUpdate(BaseModel):
     """Schema for updating a job."""
@@ -48,7 +63,7 @@ class JobStats(BaseModel):
 
 class BulkJobCreate(BaseModel):
     """Schema for creating multiple jobs at once."""
-    jobs: List[JobCreate] = Field(..., min_length=1, max_length=100, description="List of jobs to create")
+    jobs: List[JobCreate] = Field(..., min_length=1, max_length=5000, description="List of jobs to create")
 
 
 class BulkJobResponse(BaseModel):
@@ -62,7 +77,7 @@ class JobListQuery(BaseModel):
     queue_name: Optional[str] = None
     status: Optional[QueueStatus] = Field(None)
     job_type: Optional[JobTypes] = None
-    skip: int = Field(default=0, ge=0)
+    after_id: Optional[int] = Field(default=None, ge=0)
     limit: int = Field(default=50, ge=1, le=1000)
 
 
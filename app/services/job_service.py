@@ -1,24 +1,49 @@
 from typing import Optional
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio.session import AsyncSession
 from app.constants.job_types import JobTypes
 from app.constants.queue_status import QueueStatus
-from app.core import db_logger
-from app.core.logger import error
-from app.db import get_db
+from app.core import settings
+from app.core.cache import TTLCache, cached
 from app.repositories.job_repository import JobRepository
-from fastapi import  Depends, HTTPException, Query
+from fastapi import HTTPException
 
-from app.schemas import JobCreate, JobResponse, BulkJobCreate, BulkJobResponse, JobUpdate, JobStats
+from app.schemas import JobCreate, JobResponse, JobResponseList, JobPage, BulkJobCreate, BulkJobResponse, JobUpdate, JobStats
 
 
 class JobService:
-    def __init__(self, repo: JobRepository):
+    """
+    Job use cases behind the REST API.
+
+    Methods work on the request's session but never commit or roll back:
+    DBSessionMiddleware commits once when the response is successful and
+    rolls back otherwise, so each request is a single transaction.
+    """
+    def __init__(self, repo: JobRepository, cache: Optional[TTLCache] = None):
         self.repo = repo
+        self.cache = cache or TTLCache(ttl=settings.STATS_CACHE_TTL)
+
+    def _invalidate_counts(self, db: AsyncSession):
+        """
+        Drop cached stats/counts once this request's changes are committed.
+
+        Clearing before DBSessionMiddleware commits would let a concurrent
+        stats poll re-cache pre-commit counts for a full TTL, so the clear
+        runs from the session's after_commit hook instead.
+        """
+        if not db.in_transaction():
+            # Already committed (cleanup commits per batch)
+            self.cache.clear()
+            return
+        event.listen(db.sync_session, "after_commit", self._on_commit_invalidate, once=True)
+
+    def _on_commit_invalidate(self, session):
+        self.cache.clear()
 
     async def create_job(
             self,
             job_data: JobCreate,
-            db: AsyncSession = Depends(get_db)
+            db: AsyncSession
     ):
         try:
             job = await self.repo.enqueue_job(
@@ -30,16 +55,15 @@ class JobService:
                 max_tries=job_data.max_tries
             )
 
-            await db.commit()
-            return JobResponse.model_validate(job)
+            self._invalidate_counts(db)
+            return JobResponse.from_row(job)
         except Exception as e:
-            await db.rollback()
             raise HTTPException(status_code=500, detail=f"Failed to create job: {str(e)}")
 
     async def create_jobs_bulk(
             self,
             bulk_data: BulkJobCreate,
-            db: AsyncSession = Depends(get_db)
+            db: AsyncSession
     ):
         """
            Create multiple jobs at once.
@@ -48,24 +72,16 @@ class JobService:
            """
 
         try:
-            jobs = []
-            for job_data in bulk_data.jobs:
-                job = await self.repo.enqueue_job(
+            jobs = await self.repo.enqueue_jobs_bulk(
                 db,
-                job_type=job_data.job_type,
-                payload=job_data.payload,
-                queue_name=job_data.queue_name,
-                scheduled_at=job_data.scheduled_at,
-                max_tries=job_data.max_tries
+                [job_data.model_dump() for job_data in bulk_data.jobs]
             )
-                jobs.append(job)
-            await db.commit()
+            self._invalidate_counts(db)
             return BulkJobResponse(
-                created_jobs=[JobResponse.model_validate(job) for job in jobs],
+                created_jobs=JobResponseList.validate_python(jobs, from_attributes=True),
                 total_created=len(jobs),
             )
         except Exception as e:
-            await db.rollback()
             raise HTTPException(status_code=500, detail=f"Failed to create jobs: {str(e)}")
 
 
@@ -74,14 +90,15 @@ class JobService:
             queue_name: Optional[str],
             status: Optional[QueueStatus],
             job_type: Optional[JobTypes],
-            skip: int,
+            after_id: Optional[int],
             limit: int,
-            db: AsyncSession = Depends(get_db)
+            db: AsyncSession
     ):
         """
            List jobs with optional filtering.
 
-           Filter by queue, status, or job type. Supports pagination.
+           Filter by queue, status, or job type. Keyset-paginated by id:
+           pass the previous page's next_cursor as after_id.
            """
 
         try:
@@ -89,27 +106,23 @@ class JobService:
             if queue_name:
                 conditions["queue_name"] = queue_name
             if status:
-                conditions["status"] = status.value
+                conditions["status"] = status
             if job_type:
                 conditions["job_type"] = job_type.value
 
+            jobs = await self.repo.get_paginated(
+                db,
+                limit=limit,
+                after_id=after_id,
+                condition=conditions
+            )
 
-            if conditions:
-                jobs = await self.repo.get_by_condition(
-                    db,
-                    conditions,
-                    limit=limit,
-                )
-
-                jobs = jobs[skip:skip + limit if skip > 0 else jobs]
-            else:
-                jobs = await self.repo.get_paginated(
-                    db,
-                    skip=skip,
-                    limit=limit
-                )
-
-            return [JobResponse.model_validate(job) for job in jobs]
+            # A short page is the last one
+            next_cursor = jobs[-1].id if len(jobs) == limit else None
+            return JobPage.model_construct(
+                items=[JobResponse.from_row(job) for job in jobs],
+                next_cursor=next_cursor
+            )
         except HTTPException:
             raise
         except Exception as e:
@@ -118,7 +131,7 @@ class JobService:
     async def get_job(
             self,
             job_id: int,
-            db: AsyncSession = Depends(get_db)
+            db: AsyncSession
     ):
         """
         Get a specific job by ID.
@@ -127,13 +140,13 @@ class JobService:
         if not job:
             raise HTTPException(status_code=404, detail="Job not found")
 
-        return JobResponse.model_validate(job)
+        return JobResponse.from_row(job)
 
     async def update_job(
             self,
             job_id: int,
             job_update: JobUpdate,
-            db: AsyncSession = Depends(get_db)
+            db: AsyncSession
     ):
         """
         Update a job's properties.
@@ -156,19 +169,17 @@ class JobService:
             if not job:
                 raise HTTPException(status_code=404, detail="Job not found")
 
-            await db.commit()
-            return JobResponse.model_validate(job)
+            return JobResponse.from_row(job)
         except HTTPException:
             raise
         except Exception as e:
-            await db.rollback()
             raise HTTPException(status_code=500, detail=f"Failed to update job: {str(e)}")
 
 
     async def cancel_job(
             self,
             job_id: int,
-            db: AsyncSession = Depends(get_db)
+            db: AsyncSession
     ):
         """
         Cancel a job (specific action endpoint).
@@ -178,36 +189,23 @@ class JobService:
         Only works on 'pending' jobs to avoid conflicts with running workers.
         """
         try:
-            # Get the job first to check its current status
-            job = await (self.repo.get(db, job_id))
+            # Pending check and update happen atomically in one statement
+            job = await self.repo.cancel_if_pending(db, job_id)
             if not job:
-                raise HTTPException(status_code=404, detail="Job not found")
-
-            # Only allow canceling pending jobs to avoid worker conflicts
-            if job.status not in [QueueStatus.pending.value]:
+                # Only the error path pays for a second lookup
+                job = await self.repo.get(db, job_id)
+                if not job:
+                    raise HTTPException(status_code=404, detail="Job not found")
                 raise HTTPException(
                     status_code=400,
                     detail=f"Cannot cancel job with status '{job.status}'. Only 'pending' jobs can be cancelled."
                 )
 
-            # Update status to cancelled (this is safe because job is pending)
-            job = await self.repo.update(
-                db,
-                id=job_id,
-                obj_in={"status": QueueStatus.cancelled.value}
-            )
-
-            # Then soft delete
-            success = await self.repo.delete(db, id=job_id)
-            if not success:
-                raise HTTPException(status_code=500, detail="Failed to cancel job")
-
-            await db.commit()
+            self._invalidate_counts(db)
             return {"message": f"Job {job_id} cancelled successfully"}
         except HTTPException:
             raise
         except Exception as e:
-            await db.rollback()
             raise HTTPException(status_code=500, detail=f"Failed to cancel job: {str(e)}")
 
 
@@ -215,7 +213,7 @@ class JobService:
             self,
             job_id: int,
             reset_attempts: bool,
-            db: AsyncSession = Depends(get_db)
+            db: AsyncSession
     ):
         """
         Manually retry a failed job.
@@ -234,28 +232,43 @@ class JobService:
                     detail="Job not found or not in failed status"
                 )
 
-            await db.commit()
-            return JobResponse.model_validate(job)
+            self._invalidate_counts(db)
+            return JobResponse.from_row(job)
         except HTTPException:
             raise
         except Exception as e:
-            await db.rollback()
             raise HTTPException(status_code=500, detail=f"Failed to retry job: {str(e)}")
 
 
+    @cached(key=lambda db: "jobcounts")
+    async def _job_counts(self, db: AsyncSession):
+        """
+        Live job counts per (status, queue_name), from one grouped query.
+
+        Stats and the monitoring counts all read this entry, so any mix of
+        them costs at most one query per STATS_CACHE_TTL seconds.
+        """
+        return await self.repo.count_by_status_and_queue(db)
+
+    def _count_status(self, counts, status: QueueStatus, queue_name: Optional[str]) -> int:
+        return sum(
+            count for (row_status, row_queue), count in counts.items()
+            if row_status == status and (not queue_name or row_queue == queue_name)
+        )
+
     async def get_job_stats(
             self,
-            db: AsyncSession = Depends(get_db)
+            db: AsyncSession
     ):
         """
         Get overall job queue statistics.
 
         Returns counts by status and by queue.
+        Served from cache for STATS_CACHE_TTL seconds.
         """
         try:
-            stats = await self.repo.get_job_stats(db)
-
-            return JobStats(**stats)
+            counts = await self._job_counts(db)
+            return JobStats.model_construct(**self.repo.summarize_counts(counts))
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Failed to get job stats: {str(e)}")
 
@@ -265,7 +278,7 @@ class JobService:
             queue_name: str,
             status: Optional[QueueStatus],
             limit: int,
-            db: AsyncSession = Depends(get_db)
+            db: AsyncSession
     ):
         """
         Get jobs from a specific queue.
@@ -273,14 +286,13 @@ class JobService:
         Optionally filter by status within that queue.
         """
         try:
-            status_value = status.value if status else None
             jobs = await self.repo.get_jobs_by_queue(
                 db,
                 queue_name=queue_name,
-                status=status_value,
+                status=status,
                 limit=limit
             )
-            return [JobResponse.model_validate(job) for job in jobs]
+            return [JobResponse.from_row(job) for job in jobs]
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Failed to get jobs from queue: {str(e)}")
 
@@ -288,13 +300,15 @@ class JobService:
     async def get_pending_jobs_count(
             self,
             queue_name: Optional[str],
-            db: AsyncSession = Depends(get_db)
+            db: AsyncSession
     ):
         """
         Get count of pending jobs for monitoring.
+        Served from cache for STATS_CACHE_TTL seconds.
         """
         try:
-            count = await self.repo.get_pending_jobs_count(db, queue_name)
+            counts = await self._job_counts(db)
+            count = self._count_status(counts, QueueStatus.pending, queue_name)
             return {"pending_jobs": count, "queue": queue_name or "all"}
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Failed to get pending jobs count: {str(e)}")
@@ -303,13 +317,15 @@ class JobService:
     async def get_running_jobs_count(
             self,
             queue_name: Optional[str],
-            db: AsyncSession = Depends(get_db)
+            db: AsyncSession
     ):
         """
         Get count of running jobs for monitoring.
+        Served from cache for STATS_CACHE_TTL seconds.
         """
         try:
-            count = await self.repo.get_running_jobs_count(db, queue_name)
+            counts = await self._job_counts(db)
+            count = self._count_status(counts, QueueStatus.running, queue_name)
             return {"running_jobs": count, "queue": queue_name or "all"}
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Failed to get running jobs count: {str(e)}")
@@ -319,7 +335,7 @@ class JobService:
     async def reset_stale_jobs(
             self,
             timeout_minutes: int,
-            db: AsyncSession = Depends(get_db)
+            db: AsyncSession
     ):
         """
         Admin endpoint: Reset stale running jobs back to pending.
@@ -328,17 +344,16 @@ class JobService:
         """
         try:
             count = await self.repo.reset_stale_jobs(db, timeout_minutes)
-            await db.commit()
+            self._invalidate_counts(db)
             return {"message": f"Reset {count} stale jobs"}
         except Exception as e:
-            await db.rollback()
             raise HTTPException(status_code=500, detail=f"Failed to reset stale jobs: {str(e)}")
 
 
     async def cleanup_completed_jobs(
             self,
             older_than_days: int,
-            db: AsyncSession = Depends(get_db)
+            db: AsyncSession
     ):
         """
         Admin endpoint: Clean up old completed jobs.
@@ -347,8 +362,7 @@ class JobService:
         """
         try:
             count = await self.repo.cleanup_completed_jobs(db, older_than_days)
-            await db.commit()
+            self._invalidate_counts(db)
             return {"message": f"Deleted {count} completed jobs older than {older_than_days} days"}
         except Exception as e:
-            await db.rollback()
             raise HTTPException(status_code=500, detail=f"Failed to cleanup jobs: {str(e)}")
\ No newline at end of file
@@ -1,6 +0,0 @@
-from app.util.request_handler import RequestHandler
-from app.util.response_handler import ResponseHandler
-
-__all__ = [
-    'RequestHandler', 'ResponseHandler'
-]
\ No newline at end of file
@@ -8,18 +8,39 @@ Run with: python -m app.worker_main
 
 import asyncio
 import os
+import re
 import sys
 import socket
+
+import uvloop
+
 from app.db import database
 from app.repositories.job_repository import JobRepository
 from app.workers.worker import Worker
-from app.core.setup_logger import worker_logger
+from app.core.setup_logger import get_worker_logger
 from app.core.logger import info, critical
 
-repo = JobRepository()
 
-def get_job_repository() -> JobRepository:
-    return repo
+# Queue names a worker may subscribe to; bounded by the jobs.queue_name column
+QUEUE_NAME_PATTERN = re.compile(r"[\w.:-]{1,100}")
+
+
+def parse_queues(raw: str) -> list:
+    """
+    Split a comma-separated WORKER_QUEUES value into queue names
+
+    Raises:
+        ValueError: If no queue is given or a name is not allowed
+    """
+    queues = [q for q in (part.strip() for part in raw.split(",")) if q]
+    if not queues:
+        raise ValueError("WORKER_QUEUES must name at least one queue")
+
+    invalid = [q for q in queues if not QUEUE_NAME_PATTERN.fullmatch(q)]
+    if invalid:
+        raise ValueError(f"Invalid queue names in WORKER_QUEUES: {', '.join(invalid)}")
+
+    return queues
 
 
 def load_config() -> dict:
@@ -35,13 +56,11 @@ def load_config() -> dict:
         "max_poll_interval": float(os.getenv("MAX_POLL_INTERVAL", "30.0")),
         "backoff_factor": float(os.getenv("BACKOFF_FACTOR", "1.5")),
         "max_concurrent_jobs": int(os.getenv("MAX_CONCURRENT_JOBS", "3")),
-        "queues": os.getenv("WORKER_QUEUES", "default").split(","),
+        "queues": parse_queues(os.getenv("WORKER_QUEUES", "default")),
+        "listen_for_jobs": os.getenv("WORKER_LISTEN", "true").lower() in ("1", "true", "yes"),
     }
 
-    # Clean up queue names (remove whitespace)
-    config["queues"] = [q.strip() for q in config["queues"]]
-
-    info(worker_logger, "Configuration loaded", context=config)
+    info(get_worker_logger(), "Configuration loaded", context=config)
 
     return config
 
@@ -50,16 +69,18 @@ async def main():
     """
     Main function to start the worker
     """
-    info(worker_logger, "Worker process starting...")
+    info(get_worker_logger(), "Worker process starting...")
 
     try:
         # Load configuration
         config = load_config()
 
         # Initialize database
-        info(worker_logger, "Initializing database connection...")
-        await database.init_database()
-        info(worker_logger, "Database connection initialized")
+        info(get_worker_logger(), "Initializing database connection...")
+        # Long-lived worker connections sit idle between polls; ping on checkout
+        # so a connection dropped by the server can't wedge the poll loop
+        await database.init_database(pool_pre_ping=True)
+        info(get_worker_logger(), "Database connection initialized")
 
         # Create worker instance
         worker = Worker(
@@ -68,11 +89,12 @@ async def main():
             poll_interval=config["poll_interval"],
             max_poll_interval=config["max_poll_interval"],
             backoff_factor=config["backoff_factor"],
-            job_repository=get_job_repository(),
+            job_repository=JobRepository(),
             max_concurrent_jobs=config["max_concurrent_jobs"],
+            listen_for_jobs=config["listen_for_jobs"],
         )
 
-        info(worker_logger, "Worker created successfully", context={
+        info(get_worker_logger(), "Worker created successfully", context={
             "worker_id": config["worker_id"],
             "queues": config["queues"],
             "max_concurrent_jobs": config["max_concurrent_jobs"],
@@ -82,16 +104,16 @@ async def main():
         await worker.start()
 
     except KeyboardInterrupt:
-        info(worker_logger, "Worker interrupted by user (Ctrl+C)")
+        info(get_worker_logger(), "Worker interrupted by user (Ctrl+C)")
 
     except Exception as e:
-        critical(worker_logger, "Worker failed to start", context={
+        critical(get_worker_logger(), "Worker failed to start", context={
             "error": str(e),
             "error_type": type(e).__name__
         })
         sys.exit(1)
 
-    info(worker_logger, "Worker process terminated")
+    info(get_worker_logger(), "Worker process terminated")
 
 
 if __name__ == "__main__":
@@ -99,12 +121,15 @@ if __name__ == "__main__":
     Entry point when running: python -m app.worker_main
     or: python app/worker_main.py
     """
+    # libuv-based event loop, same as the API server runs under
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
-        info(worker_logger, "Worker stopped by user")
+        info(get_worker_logger(), "Worker stopped by user")
     except Exception as e:
-        critical(worker_logger, "Fatal error", context={
+        critical(get_worker_logger(), "Fatal error", context={
             "error": str(e)
         })
         sys.exit(1)
\ No newline at end of file
@@ -4,15 +4,36 @@ Maps job_type to handler instances
 """
 
 from typing import Dict, Callable
-from app.workers.job_handlers import EmailHandler, ReportHandler, ImageHandler
+from app.constants.job_types import JobTypes
+from app.workers.job_handlers import MockHandler
 from app.workers.job_handlers.base_handler import BaseJobHandler
-from app.core.setup_logger import worker_logger
+from app.core.setup_logger import get_worker_logger
 from app.core.logger import info
 
 # Initialize handler instances
-email_handler = EmailHandler()
-report_handler = ReportHandler()
-image_handler = ImageHandler()
+email_handler = MockHandler(
+    JobTypes.emails.value,
+    delay=3.0,
+    fields={"to": "unknown@example.com", "subject": "No subject"},
+    status="sent",
+    message="Email sent successfully (mock)",
+)
+report_handler = MockHandler(
+    JobTypes.report_generation.value,
+    delay=3.6,
+    fields={"report_type": "unknown", "report_id": "unknown"},
+    status="generated",
+    message="Report generated successfully (mock)",
+    outputs={"file_path": "/tmp/report_{report_id}.pdf"},
+)
+image_handler = MockHandler(
+    JobTypes.images_processing.value,
+    delay=3.5,
+    fields={"image_url": "unknown", "image_id": "unknown", "operations": []},
+    status="processed",
+    message="Image processed successfully (mock)",
+    outputs={"output_path": "/tmp/processed_{image_id}.jpg"},
+)
 
 # Handler Registry - maps job_type string to handler instance
 HANDLERS: Dict[str, BaseJobHandler] = {
@@ -21,6 +42,9 @@ HANDLERS: Dict[str, BaseJobHandler] = {
     image_handler.job_type: image_handler,
 }
 
+# Bound once; register_handler mutates HANDLERS in place so this stays current
+_lookup_handler = HANDLERS.__getitem__
+
 
 def get_handler(job_type: str) -> BaseJobHandler:
     """
@@ -35,16 +59,14 @@ def get_handler(job_type: str) -> BaseJobHandler:
     Raises:
         ValueError: If job_type is not registered
     """
-    handler = HANDLERS.get(job_type)
-
-    if not handler:
-        available_types = ", ".join(HANDLERS.keys())
+    try:
+        return _lookup_handler(job_type)
+    except KeyError:
+        # Message is only built on a miss
         raise ValueError(
             f"No handler registered for job_type: '{job_type}'. "
-            f"Available types: {available_types}"
-        )
-
-    return handler
+            f"Available types: {', '.join(HANDLERS)}"
+        ) from None
 
 
 def register_handler(handler: BaseJobHandler) -> None:
@@ -58,7 +80,7 @@ def register_handler(handler: BaseJobHandler) -> None:
         raise TypeError("Handler must inherit from BaseJobHandler")
 
     job_type = handler.job_type
-    info(worker_logger, f"Registering handler for job_type: {job_type}")
+    info(get_worker_logger(), f"Registering handler for job_type: {job_type}")
     HANDLERS[job_type] = handler
 
 
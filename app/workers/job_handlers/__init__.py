@@ -1,12 +1,8 @@
 from app.workers.job_handlers.base_handler import BaseJobHandler
-from app.workers.job_handlers.email_handler import EmailHandler
-from app.workers.job_handlers.image_handler import ImageHandler
-from app.workers.job_handlers.report_handler import ReportHandler
+from app.workers.job_handlers.mock_handler import MockHandler
 
 
 __all__ = [
    'BaseJobHandler',
-   'EmailHandler',
-   'ImageHandler',
-    'ReportHandler',
-]
\ No newline at end of file
+   'MockHandler',
+]
@@ -4,8 +4,8 @@ Provides common functionality and interface
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any
-from app.core.setup_logger import worker_logger
+from typing import Any, Dict
+from app.core.setup_logger import get_worker_logger
 
 
 class BaseJobHandler(ABC):
@@ -14,8 +14,10 @@ class BaseJobHandler(ABC):
     All handlers should inherit from this class
     """
 
-    def __init__(self):
-        self.logger = worker_logger
+    @property
+    def logger(self):
+        """Worker logger, built on first use rather than when handlers are registered"""
+        return get_worker_logger()
 
     @abstractmethod
     async def execute(self, payload: Dict[str, Any]) -> Dict[str, Any]:
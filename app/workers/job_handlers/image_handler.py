@@ -1,50 +0,0 @@
-"""
-Image processing job handler
-"""
-
-import asyncio
-from typing import Dict, Any
-
-from app.constants.job_types import JobTypes
-from app.workers.job_handlers.base_handler import BaseJobHandler
-from app.core.logger import info, debug
-
-class ImageHandler(BaseJobHandler):
-    """Handler for image processing jobs"""
-    @property
-    def job_type(self) -> str:
-        return JobTypes.images_processing.value
-
-    async def execute(self, payload: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Process image processing job
-
-        Expected payload:
-        {
-            "image_url": "https://example.com/image.jpg",
-            "image_id": 456,
-            "operations": ["resize", "crop", "watermark"]
-        }
-        """
-        debug(self.logger, "Image processing started", context=payload)
-
-        # Extract image details
-        image_url = payload.get("image_url", "unknown")
-        image_id = payload.get("image_id", "unknown")
-        operations = payload.get("operations", [])
-
-        # Simulate image processing work
-        # TODO: Replace with actual image processing logic (PIL, OpenCV, etc.)
-        await asyncio.sleep(3.5)
-
-        result = {
-            "status": "processed",
-            "image_url": image_url,
-            "image_id": image_id,
-            "operations": operations,
-            "output_path": f"/tmp/processed_{image_id}.jpg",
-            "message": "Image processed successfully (mock)"
-        }
-
-        info(self.logger, "Image processed successfully", context=result)
-        return result
\ No newline at end of file
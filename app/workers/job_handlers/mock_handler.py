@@ -0,0 +1,73 @@
+"""
+Mock job handler
+Simulates a job by sleeping, then echoes selected payload fields
+"""
+
+import asyncio
+import logging
+from typing import Dict, Any, Optional
+
+from app.workers.job_handlers.base_handler import BaseJobHandler
+from app.core.logger import debug
+
+
+class MockHandler(BaseJobHandler):
+    """
+    Parametrized stand-in for a real handler
+
+    One class serves every mock job type; each registered instance only
+    differs in its delay and in which payload fields it reports back.
+    """
+
+    def __init__(
+            self,
+            job_type: str,
+            delay: float,
+            fields: Dict[str, Any],
+            status: str = "ok",
+            message: str = "Job completed successfully (mock)",
+            outputs: Optional[Dict[str, str]] = None
+    ):
+        """
+        Args:
+            job_type: Job type this instance handles
+            delay: Seconds of simulated work
+            fields: Payload keys copied into the result, with their defaults
+            status: Result status string
+            message: Result message
+            outputs: Extra result keys, formatted from the extracted fields
+        """
+        super().__init__()
+        self._job_type = job_type
+        self._delay = delay
+        self._fields = tuple(fields.items())
+        self._status = status
+        self._message = message
+        self._outputs = tuple((outputs or {}).items())
+
+    @property
+    def job_type(self) -> str:
+        return self._job_type
+
+    async def execute(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        if self.logger.isEnabledFor(logging.DEBUG):
+            debug(self.logger, "Mock handler started", context={"job_type": self._job_type})
+
+        # Simulate the work
+        # TODO: Replace with real handlers (SMTP, PIL, report rendering, ...)
+        await asyncio.sleep(self._delay)
+        result = self._build_result(payload)
+
+        # The worker logs every completed job with its result at INFO
+        if self.logger.isEnabledFor(logging.DEBUG):
+            debug(self.logger, "Mock job finished", context={"job_type": self._job_type, **result})
+        return result
+
+    def _build_result(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Echo the configured payload fields and outputs"""
+        values = {key: payload.get(key, default) for key, default in self._fields}
+        result = {"status": self._status, **values}
+        for key, template in self._outputs:
+            result[key] = template.format(**values)
+        result["message"] = self._message
+        return result
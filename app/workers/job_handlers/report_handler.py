@@ -1,49 +0,0 @@
-"""
-Report generation job handler
-"""
-
-import asyncio
-from typing import Dict, Any
-
-from app.constants.job_types import JobTypes
-from app.workers.job_handlers.base_handler import BaseJobHandler
-from app.core.logger import info, debug
-
-
-class ReportHandler(BaseJobHandler):
-    """Handler for report generation jobs"""
-    @property
-    def job_type(self) -> str:
-        return JobTypes.report_generation.value
-
-    async def execute(self, payload: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Process report generation job
-
-        Expected payload:
-        {
-            "report_type": "sales|financial|analytics",
-            "report_id": 123,
-            "filters": {...}
-        }
-        """
-        debug(self.logger, "Report generation started", context=payload)
-
-        # Extract report details
-        report_type = payload.get("report_type", "unknown")
-        report_id = payload.get("report_id", "unknown")
-
-        # Simulate report generation work
-        # TODO: Replace with actual report generation logic
-        await asyncio.sleep(3.6)
-
-        result = {
-            "status": "generated",
-            "report_type": report_type,
-            "report_id": report_id,
-            "file_path": f"/tmp/report_{report_id}.pdf",
-            "message": "Report generated successfully (mock)"
-        }
-
-        info(self.logger, "Report generated successfully", context=result)
-        return result
\ No newline at end of file
@@ -0,0 +1,87 @@
+"""
+Job notification listener
+Keeps one connection LISTENing for new-job NOTIFYs so idle workers don't poll
+"""
+import asyncio
+from typing import List
+
+from app.db import database
+from app.repositories.job_repository import job_channel
+from app.core.setup_logger import get_worker_logger
+from app.core.logger import info, warning
+
+
+class JobNotificationListener:
+    """
+    LISTENs on the new-job channel of each queue and sets `wakeup` on NOTIFY
+
+    Holds a pooled connection for as long as it runs. If that connection
+    drops, `wakeup` is set too so the worker notices and calls start() again.
+    """
+
+    def __init__(self, queues: List[str]):
+        self.channels = sorted({job_channel(queue) for queue in queues})
+        self.wakeup = asyncio.Event()
+        self._connection = None
+        self._driver_connection = None
+
+    @property
+    def active(self) -> bool:
+        """True while the LISTEN connection is open"""
+        return self._driver_connection is not None and not self._driver_connection.is_closed()
+
+    async def start(self) -> None:
+        """Check out a connection and LISTEN on every channel"""
+        connection = await database.engine.connect()
+        try:
+            raw_connection = await connection.get_raw_connection()
+            driver_connection = raw_connection.driver_connection
+            for channel in self.channels:
+                await driver_connection.add_listener(channel, self._on_notify)
+            driver_connection.add_termination_listener(self._on_terminated)
+        except Exception:
+            await connection.invalidate()
+            await connection.close()
+            raise
+
+        self._connection = connection
+        self._driver_connection = driver_connection
+        info(get_worker_logger(), "Listening for new jobs", context={"channels": self.channels})
+
+    async def wait(self, timeout: float) -> bool:
+        """
+        Wait until a NOTIFY arrives or timeout seconds pass
+
+        Returns:
+            True if woken by a notification
+        """
+        try:
+            await asyncio.wait_for(self.wakeup.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    async def stop(self) -> None:
+        """UNLISTEN and hand the connection back to the pool"""
+        connection, driver_connection = self._connection, self._driver_connection
+        self._connection = self._driver_connection = None
+        if connection is None:
+            return
+
+        try:
+            driver_connection.remove_termination_listener(self._on_terminated)
+            if driver_connection.is_closed():
+                raise ConnectionError("listener connection is closed")
+            for channel in self.channels:
+                await driver_connection.remove_listener(channel, self._on_notify)
+        except Exception:
+            # Broken connection; make sure the pool doesn't reuse it
+            await connection.invalidate()
+        await connection.close()
+
+    def _on_notify(self, connection, pid, channel, payload) -> None:
+        self.wakeup.set()
+
+    def _on_terminated(self, connection) -> None:
+        warning(get_worker_logger(), "Job notification connection lost")
+        self.wakeup.set()
@@ -1,28 +1,45 @@
 """
 Main Worker Class
-Handles background job processing with exponential backoff polling
+Handles background job processing with adaptive polling
 """
 import asyncio
+import collections
+import logging
+import random
 import signal
-import sys
-from datetime import datetime
+import time
 from typing import List, Optional
-from zoneinfo import available_timezones
-
-from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db import database
-from app.db.database import get_db, SessionLocal
-from app.repositories import job_repository
+from app.models.jobs_model import Jobs
 from app.repositories.job_repository import JobRepository
 from app.workers.handlers import get_handler
-from app.core.setup_logger import worker_logger
+from app.workers.listener import JobNotificationListener
+from app.core.setup_logger import get_worker_logger
 from app.core.logger import info, debug, warning, error, critical
 
 
+# Completions written per UPDATE by the flusher
+COMPLETION_BATCH_SIZE = 64
+
+# How long the flusher lets completions accumulate after the first one arrives
+COMPLETION_LINGER_SECONDS = 0.01
+
+# Recent claim attempts the poll interval adapts to
+CLAIM_HIT_WINDOW = 64
+
+# After a NOTIFY, wait up to this fraction of poll_interval before claiming so
+# workers woken by the same burst don't all hit SKIP LOCKED at once
+NOTIFY_JITTER_FRACTION = 0.1
+
+# Retry delay after a failed LISTEN, doubling per failure up to the max
+LISTEN_RETRY_SECONDS = 5.0
+LISTEN_RETRY_MAX_SECONDS = 300.0
+
+
 class Worker:
     """
-    Background job worker with exponential backoff polling
+    Background job worker with adaptive polling
     Processes jobs from the queue using FOR UPDATE SKIP LOCKED
     """
 
@@ -35,6 +52,7 @@ class Worker:
             backoff_factor: float = 1.5,
             job_repository: JobRepository = JobRepository,
             max_concurrent_jobs: int = 1,
+            listen_for_jobs: bool = True,
     ):
         """
         Initialize the worker
@@ -44,7 +62,8 @@ class Worker:
             queues: List of queue names to process
             poll_interval: Initial polling interval in seconds
             max_poll_interval: Maximum polling interval in seconds
-            backoff_factor: Backoff multiplier when no jobs found
+            backoff_factor: Most the poll interval may grow per empty poll
+            listen_for_jobs: Wait on LISTEN/NOTIFY when idle instead of polling with backoff
         """
 
         self.worker_id = worker_id
@@ -55,49 +74,91 @@ class Worker:
         self.job_repository = job_repository
         self.max_concurrent_jobs = max_concurrent_jobs
 
+        # Static log context, merged in only when a debug line is actually emitted
+        self._base_ctx = {"worker_id": self.worker_id, "queues": self.queues}
+
+        # Wakes the idle loop as soon as jobs are enqueued on our queues
+        self.listener: Optional[JobNotificationListener] = (
+            JobNotificationListener(queues) if listen_for_jobs else None
+        )
+        # While LISTEN keeps failing, poll and only retry it after a backoff
+        self._listen_failing = False
+        self._listen_retry_delay = LISTEN_RETRY_SECONDS
+        self._listen_retry_at = 0.0
+
         #track active jobs
         self.active_jobs: set = set()
 
-        # Current polling interval (starts at poll_interval, increases with backoff)
+        # One permit per concurrent job; held from claim until the job's task ends
+        self._slots = asyncio.Semaphore(max_concurrent_jobs)
+
+        # (job_id, result, future) waiting to be marked completed in one UPDATE
+        self._completion_queue: asyncio.Queue = asyncio.Queue()
+        self._flusher_task: Optional[asyncio.Task] = None
+
+        # Current polling interval (starts at poll_interval, grows as claims miss)
         self.current_poll_interval = poll_interval
 
-        # Shutdown flag
+        # 1/0 per recent claim attempt: hit-rate over the last CLAIM_HIT_WINDOW polls
+        self._hits = collections.deque(maxlen=CLAIM_HIT_WINDOW)
+
+        # Shutdown flag, plus an event so sleeps and waits end as soon as it's set
         self.should_shutdown = False
+        self._shutdown_event = asyncio.Event()
 
         # Statistics
         self.jobs_processed = 0
         self.jobs_failed = 0
         self.jobs_succeeded = 0
 
-        info(worker_logger, "Worker initialized", context={
+        info(get_worker_logger(), "Worker initialized", context={
             "worker_id": self.worker_id,
             "queues": self.queues,
             "poll_interval": self.poll_interval,
             "max_poll_interval": self.max_poll_interval,
             "backoff_factor": self.backoff_factor,
-            "max_concurrent_jobs": self.max_concurrent_jobs
+            "max_concurrent_jobs": self.max_concurrent_jobs,
+            "listen_for_jobs": listen_for_jobs
         })
 
 
     def setup_signal_handlers(self):
-        """Setup signal handlers for graceful shutdown"""
+        """
+        Setup signal handlers for graceful shutdown
 
-        def signal_handler(signum, frame):
-            signal_name = signal.Signals(signum).name
-            warning(worker_logger, f"Received {signal_name} signal, initiating graceful shutdown...")
-            self.should_shutdown = True
+        Handlers run as event loop callbacks, so a signal wakes a worker
+        sleeping in backoff or LISTEN straight away.
+        """
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(sig, self._on_shutdown_signal, sig.name)
+
+        info(get_worker_logger(), "Signal handlers registered (SIGTERM, SIGINT)")
 
-        signal.signal(signal.SIGTERM, signal_handler)
-        signal.signal(signal.SIGINT, signal_handler)
+    def _on_shutdown_signal(self, signal_name: str):
+        warning(get_worker_logger(), f"Received {signal_name} signal, initiating graceful shutdown...")
+        self._request_shutdown()
 
-        info(worker_logger, "Signal handlers registered (SIGTERM, SIGINT)")
+    def _request_shutdown(self):
+        """Set the shutdown flag and wake anything waiting on the loop"""
+        self.should_shutdown = True
+        self._shutdown_event.set()
+        if self.listener is not None:
+            self.listener.wakeup.set()
+
+    async def _sleep(self, timeout: float):
+        """Sleep up to timeout seconds, returning early on shutdown"""
+        try:
+            await asyncio.wait_for(self._shutdown_event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
 
     async def start(self):
         """
         Start the worker and begin processing jobs
         Main entry point for the worker
         """
-        info(worker_logger, "Worker starting...", context={
+        info(get_worker_logger(), "Worker starting...", context={
             "worker_id": self.worker_id,
             "queues": self.queues
         })
@@ -106,11 +167,15 @@ class Worker:
             # Setup signal handlers for graceful shutdown
             self.setup_signal_handlers()
 
+            await self._ensure_listener()
+
+            self._flusher_task = asyncio.create_task(self._flush_completions())
+
             # Main processing loop
             await self._processing_loop()
 
         except Exception as e:
-            critical(worker_logger, "Worker crashed with unexpected error", context={
+            critical(get_worker_logger(), "Worker crashed with unexpected error", context={
                 "worker_id": self.worker_id,
                 "error": str(e),
                 "error_type": type(e).__name__
@@ -119,259 +184,121 @@ class Worker:
         finally:
             await self._shutdown()
 
-    # async def _processing_loop(self):
-    #     """
-    #     Main processing loop
-    #     Continuously polls for jobs and processes them
-    #     """
-    #     info(worker_logger, "Entering main processing loop")
-    #
-    #     while not self.should_shutdown:
-    #         try:
-    #             # Get database session
-    #             async with database.SessionLocal() as db:
-    #                 # Try to claim and process a job
-    #                 job_processed = await self._process_single_job(db)
-    #
-    #                 if job_processed:
-    #                     # Reset poll interval when job was found
-    #                     self.current_poll_interval = self.poll_interval
-    #                     debug(worker_logger, "Job processed, resetting poll interval", context={
-    #                         "poll_interval": self.current_poll_interval
-    #                     })
-    #                 else:
-    #                     # No job found, apply exponential backoff
-    #                     await self._apply_backoff()
-    #
-    #         except Exception as e:
-    #             error(worker_logger, "Error in processing loop", context={
-    #                 "error": str(e),
-    #                 "error_type": type(e).__name__
-    #             })
-    #             # Wait before retrying to avoid tight error loops
-    #             await asyncio.sleep(self.poll_interval)
-    #
-    #     info(worker_logger, "Processing loop terminated")
-    #
-    # async def _process_single_job(self, db: AsyncSession) -> bool:
-    #     """
-    #     Attempt to claim and process a single job
-    #
-    #     Args:
-    #         db: Database session
-    #
-    #     Returns:
-    #         True if a job was processed, False if no job available
-    #     """
-    #     # Claim next available job
-    #     job = await self.job_repository.claim_next_job(
-    #         db=db,
-    #         queue_names=self.queues,
-    #         worker_id=self.worker_id
-    #     )
-    #
-    #     if not job:
-    #         debug(worker_logger, "No jobs available", context={
-    #             "queues": self.queues,
-    #             "worker_id": self.worker_id
-    #         })
-    #         return False
-    #
-    #     # Job claimed successfully
-    #     info(worker_logger, "Job claimed", context={
-    #         "job_id": job.id,
-    #         "job_type": job.job_type,
-    #         "queue_name": job.queue_name,
-    #         "attempts": job.attempts,
-    #         "worker_id": self.worker_id
-    #     })
-    #
-    #     # Process the job
-    #     start_time = datetime.now()
-    #
-    #     try:
-    #         # Get handler for this job type
-    #         handler = get_handler(job.job_type)
-    #
-    #         info(worker_logger, "Executing job handler", context={
-    #             "job_id": job.id,
-    #             "job_type": job.job_type,
-    #             "handler": handler.__class__.__name__
-    #         })
-    #
-    #         # Execute handler
-    #         result = await handler.execute(job.payload)
-    #
-    #         # Mark job as completed
-    #         await self.job_repository.mark_job_completed(db, job.id, result)
-    #         await db.commit()
-    #
-    #         # Calculate duration
-    #         duration = (datetime.now() - start_time).total_seconds()
-    #
-    #         # Update statistics
-    #         self.jobs_processed += 1
-    #         self.jobs_succeeded += 1
-    #
-    #         info(worker_logger, "Job completed successfully", context={
-    #             "job_id": job.id,
-    #             "job_type": job.job_type,
-    #             "duration_seconds": round(duration, 2),
-    #             "attempts": job.attempts,
-    #             "result": result
-    #         })
-    #
-    #         return True
-    #
-    #     except ValueError as e:
-    #         # Handler not found or invalid job type
-    #         error(worker_logger, "Invalid job type or handler not found", context={
-    #             "job_id": job.id,
-    #             "job_type": job.job_type,
-    #             "error": str(e)
-    #         })
-    #
-    #         # Mark as permanently failed (no retry for invalid job types)
-    #         await self.job_repository.mark_job_failed(
-    #             db=db,
-    #             job_id=job.id,
-    #             error_message=f"Invalid job type: {str(e)}",
-    #             retry=False
-    #         )
-    #         await db.commit()
-    #
-    #         self.jobs_processed += 1
-    #         self.jobs_failed += 1
-    #
-    #         return True
-    #
-    #     except Exception as e:
-    #         # Handler execution failed
-    #         duration = (datetime.now() - start_time).total_seconds()
-    #
-    #         error(worker_logger, "Job processing failed", context={
-    #             "job_id": job.id,
-    #             "job_type": job.job_type,
-    #             "error": str(e),
-    #             "error_type": type(e).__name__,
-    #             "duration_seconds": round(duration, 2),
-    #             "attempts": job.attempts
-    #         })
-    #
-    #         # Mark job as failed (will retry if attempts < max_tries)
-    #         await self.job_repository.mark_job_failed(
-    #             db=db,
-    #             job_id=job.id,
-    #             error_message=str(e),
-    #             retry=True
-    #         )
-    #         await db.commit()
-    #
-    #         self.jobs_processed += 1
-    #         self.jobs_failed += 1
-    #
-    #         return True
-
     async def _processing_loop(self):
         """
         Main loop for processing jobs
         Continuously polls for jobs and process them
         """
-        info(worker_logger, "Entering main processing loop...", context={
+        info(get_worker_logger(), "Entering main processing loop...", context={
             "max_concurrent_jobs": self.max_concurrent_jobs,
         })
 
+        # Hot-path attributes bound once; none of them is reassigned while running
+        active_jobs = self.active_jobs
+        repo = self.job_repository
+        queues = self.queues
+        worker_id = self.worker_id
+        hits = self._hits
+        process_job = self.__process_job_async
+        on_task_done = self._on_task_done
+
         while not self.should_shutdown:
             try:
-                # Cleanup completed tasks to free up slots
-                await self._cleanup_completed_tasks()
+                # Blocks while every slot is busy; a finishing job wakes it
+                reserved = await self._reserve_slots()
+                if self.should_shutdown:
+                    self._release_slots(reserved)
+                    break
+
+                if get_worker_logger().isEnabledFor(logging.DEBUG):
+                    debug(get_worker_logger(), "Loop iteration", context={
+                        **self._base_ctx,
+                        "active_jobs": len(active_jobs),
+                        "available_slots": reserved,
+                        "max_concurrent_jobs": self.max_concurrent_jobs,
+                    })
 
-                # check how many slots are available
-                available = self._available_slots()
+                # Notifications from here on mean there may be new work
+                if self.listener is not None:
+                    self.listener.wakeup.clear()
 
-                debug(worker_logger, "Loop iteration", context={
-                    "active_jobs": len(self.active_jobs),
-                    "available_slots": available,
-                    "max_concurrent_jobs": self.max_concurrent_jobs,
-                })
-
-                if available > 0:
-                    async with database.SessionLocal() as db:
-                        job = await self.job_repository.claim_next_job(
+                jobs = []
+                try:
+                    # Fill every free slot with one claim round trip; the
+                    # transaction block commits the whole batch once on exit
+                    async with database.SessionLocal() as db, db.begin():
+                        jobs = await repo.claim_next_jobs(
                             db=db,
-                            queue_names=self.queues,
-                            worker_id=self.worker_id,
+                            queue_names=queues,
+                            worker_id=worker_id,
+                            batch_size=reserved,
                         )
+                finally:
+                    # Slots that didn't get a job go straight back
+                    self._release_slots(reserved - len(jobs))
+
+                hits.append(1 if jobs else 0)
+
+                if jobs:
+                    info(get_worker_logger(), "Jobs claimed, creating background tasks", context={
+                        "job_ids": [job.id for job in jobs],
+                        "claimed": len(jobs),
+                        "active_jobs": len(active_jobs),
+                        "available_slots": reserved - len(jobs),
+                    })
 
-                        if job:
-                            #Job claimed! task to process it
-
-                            info(worker_logger, "Job claimed, creating background task", context={
-                                "job_id": job.id,
-                                "job_type": job.job_type,
-                                "queue_name": job.queue_name,
-                                "active_jobs": len(self.active_jobs),
-                                "available_slots": available-1,
-                            })
-
-                            await db.commit()
-
-                            #create background task
-                            task = asyncio.create_task(
-                                self.__process_job_async(job.id)
-                            )
-
-                            self.active_jobs.add(task)
+                    #create background tasks
+                    for job in jobs:
+                        task = asyncio.create_task(
+                            process_job(job)
+                        )
+                        # Frees the slot as soon as the job finishes
+                        task.add_done_callback(on_task_done)
+                        active_jobs.add(task)
 
-                            #Resent poll interval since we've found a job
-                            self.current_poll_interval = self.poll_interval
+                    #Resent poll interval since we've found a job
+                    self.current_poll_interval = self.poll_interval
 
-                        else:
-                            #No Jobs available
+                else:
+                    #No Jobs available
 
-                            debug(worker_logger, "No jobs available in queue", context={
-                                "queues" : self.queues,
-                                "active_jobs": len(self.active_jobs),
-                            })
+                    if get_worker_logger().isEnabledFor(logging.DEBUG):
+                        debug(get_worker_logger(), "No jobs available in queue", context={
+                            **self._base_ctx,
+                            "active_jobs": len(active_jobs),
+                        })
 
-                            #Only apply exponential backoff if NO jobs are running
-                            if len(self.active_jobs) == 0:
-                                await self._apply_backoff()
-                            else:
-                                #Jobs are running check again soon
-                                await asyncio.sleep(self.poll_interval)
+                    #Only apply backoff if NO jobs are running
+                    if len(active_jobs) == 0:
+                        await self._wait_idle()
+                    else:
+                        #Jobs are running check again soon
+                        await self._wait_for_jobs(self.poll_interval)
 
-                else:
-                    #No slots are available, wait ....
-                    debug(worker_logger, "All slots are occupied, waiting...", context={
-                        "active_jobs": len(self.active_jobs),
-                        "max_concurrent": self.max_concurrent_jobs,
-                    })
-
-                    await asyncio.sleep(self.poll_interval)
             except Exception as e:
-                error(worker_logger, "Worker crashed with unexpected error", context={
+                error(get_worker_logger(), "Worker crashed with unexpected error", context={
                     "error": str(e),
                     "error_type": type(e).__name__,
-                    "worker_id": self.worker_id,
-                    "active_jobs": len(self.active_jobs),
+                    "worker_id": worker_id,
+                    "active_jobs": len(active_jobs),
                 })
 
-                await asyncio.sleep(self.poll_interval)
+                await self._sleep(self.poll_interval)
 
-        info(worker_logger, "Exiting main processing loop")
+        info(get_worker_logger(), "Exiting main processing loop")
 
         if self.active_jobs:
-            warning(worker_logger, f"Waiting for {len(self.active_jobs)} active jobs to complete")
-            await asyncio.wait(self.active_jobs, timeout=60)
+            warning(get_worker_logger(), f"Waiting for {len(self.active_jobs)} active jobs to complete")
+            _, pending = await asyncio.wait(set(self.active_jobs), timeout=60)
 
-            remaining_jobs = [task for task in self.active_jobs if not task.done()]
-            if remaining_jobs:
-                warning(worker_logger, f"Forcefully cancelling {len(remaining_jobs)} remaining jobs after timeout")
-                for task in remaining_jobs:
+            if pending:
+                warning(get_worker_logger(), f"Forcefully cancelling {len(pending)} remaining jobs after timeout")
+                for task in pending:
                     task.cancel()
+                # Let the cancellations land before the flusher and pool shut down
+                await asyncio.gather(*pending, return_exceptions=True)
 
-    async def __process_job_async(self, job_id: int):
+    async def __process_job_async(self, job: Jobs):
         """
         Process a single job asynchronously as background task
 
@@ -379,34 +306,26 @@ class Worker:
         It handles the complete job lifecycle. execute handler, mark complete/failed
 
         Args:
-             :param job_id: ID of the job to process
+             :param job: The job row returned by the claim (already 'running')
 
         """
 
-        start_time = datetime.now()
-        job = None
+        start_time = time.monotonic()
+        job_id = job.id
 
         try:
-            async with database.SessionLocal() as db:
-                job = await self.job_repository.get(db, job_id)
-
-                if not job:
-                    warning(worker_logger, "Job not found", context={
-                        "job_id": job_id
-                    })
-                    return
-
-                #get handler for the job
-                try:
-                    handler = get_handler(job.job_type)
-                except ValueError as e:
-                    #invalid job type - mark permanantly failed
-                    error(worker_logger, "Invalid job type or handler not found", context={
-                        "job_id": job_id,
-                        "job_type": job.job_type,
-                        "error": str(e),
-                    })
+            #get handler for the job
+            try:
+                handler = get_handler(job.job_type)
+            except ValueError as e:
+                #invalid job type - mark permanantly failed
+                error(get_worker_logger(), "Invalid job type or handler not found", context={
+                    "job_id": job_id,
+                    "job_type": job.job_type,
+                    "error": str(e),
+                })
 
+                async with database.SessionLocal() as db:
                     await self.job_repository.mark_job_failed(
                         db=db,
                         job_id=job_id,
@@ -416,11 +335,11 @@ class Worker:
 
                     await db.commit()
 
-                    self.jobs_failed += 1
-                    return
+                self.jobs_failed += 1
+                return
 
             #execute the handler
-            info(worker_logger, "Processing job", context={
+            info(get_worker_logger(), "Processing job", context={
                 "job_id": job_id,
                 "job_type": job.job_type,
                 "handler": handler.__class__.__name__,
@@ -430,15 +349,22 @@ class Worker:
             try:
                 result = await handler.execute(job.payload)
 
-                #Mark job as completed
-                await self.job_repository.mark_job_completed(db, job_id, result)
-                await db.commit()
+                #Mark job as completed (batched with other completions by the flusher)
+                written = asyncio.get_running_loop().create_future()
+                self._completion_queue.put_nowait((job_id, result, written))
+
+                # Hold the slot until the completion is committed
+                if not await written:
+                    # The flusher logged the error; the job stays 'running'
+                    # until reset_stale_jobs hands it out again
+                    self.jobs_failed += 1
+                    return
 
-                duration = (datetime.now() - start_time).total_seconds()
+                duration = time.monotonic() - start_time
 
                 self.jobs_succeeded += 1
 
-                info(worker_logger, "Job completed successfully", context={
+                info(get_worker_logger(), "Job completed successfully", context={
                     "job_id": job_id,
                     "job_type": job.job_type,
                     "duration_seconds": round(duration, 2),
@@ -448,9 +374,9 @@ class Worker:
                 })
             except Exception as e:
                 #handler execution failed
-                duration = (datetime.now() - start_time).total_seconds()
+                duration = time.monotonic() - start_time
 
-                error(worker_logger, "Job processing failed", context={
+                error(get_worker_logger(), "Job processing failed", context={
                     "job_id": job_id,
                     "job_type" : job.job_type,
                     "error": str(e),
@@ -459,17 +385,19 @@ class Worker:
                     "attempts": job.attempts
                 })
 
-                await self.job_repository.mark_job_failed(
-                    db=db,
-                    job_id=job_id,
-                    error_message=str(e),
-                    retry=True  #we will try with exponential backoff
-                )
+                # A session is only checked out once there is something to write
+                async with database.SessionLocal() as db:
+                    await self.job_repository.mark_job_failed(
+                        db=db,
+                        job_id=job_id,
+                        error_message=str(e),
+                        retry=True  #we will try with exponential backoff
+                    )
 
-                await db.commit()
+                    await db.commit()
                 self.jobs_failed += 1
         except Exception as e:
-            error(worker_logger, "Unexpected error in job task", context={
+            error(get_worker_logger(), "Unexpected error in job task", context={
                 "job_id": job_id,
                 "error": str(e),
                 "error_type": type(e).__name__,
@@ -480,39 +408,180 @@ class Worker:
             self.jobs_processed += 1
 
 
+    async def _flush_completions(self):
+        """
+        Background task: write queued completions in batches
+
+        Waits for the first completion, lets more accumulate for
+        COMPLETION_LINGER_SECONDS, then marks up to COMPLETION_BATCH_SIZE
+        jobs completed with one UPDATE and one commit. Each job task waits
+        on its future, which resolves to whether the write was committed.
+        """
+        while True:
+            batch = [await self._completion_queue.get()]
+            await asyncio.sleep(COMPLETION_LINGER_SECONDS)
+            while len(batch) < COMPLETION_BATCH_SIZE:
+                try:
+                    batch.append(self._completion_queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+
+            written = False
+            try:
+                async with database.SessionLocal() as db:
+                    await self.job_repository.mark_jobs_completed(
+                        db, [(job_id, result) for job_id, result, _ in batch]
+                    )
+                    await db.commit()
+                written = True
+            except Exception as e:
+                # Jobs stay 'running'; reset_stale_jobs hands them out again
+                error(get_worker_logger(), "Failed to record job completions", context={
+                    "job_ids": [job_id for job_id, _, _ in batch],
+                    "error": str(e),
+                    "error_type": type(e).__name__,
+                })
+            finally:
+                for _, _, future in batch:
+                    # A job task cancelled at shutdown cancels its future too
+                    if not future.done():
+                        future.set_result(written)
+                    self._completion_queue.task_done()
+
+    async def _stop_flusher(self, timeout: float = 10):
+        """Write any completions still queued, then stop the flusher"""
+        if self._flusher_task is None:
+            return
+
+        try:
+            await asyncio.wait_for(self._completion_queue.join(), timeout=timeout)
+        except asyncio.TimeoutError:
+            warning(get_worker_logger(), "Timed out flushing job completions", context={
+                "pending_completions": self._completion_queue.qsize()
+            })
+
+        self._flusher_task.cancel()
+        try:
+            await self._flusher_task
+        except asyncio.CancelledError:
+            pass
+        self._flusher_task = None
+
+    async def _ensure_listener(self) -> bool:
+        """
+        (Re)start the NOTIFY listener if it isn't running
+
+        After a failure the worker polls, and start() is only retried once
+        an exponentially growing delay has passed, so a LISTEN that can't
+        work (e.g. behind PgBouncer transaction pooling) doesn't cost a
+        checkout and a warning on every idle iteration.
+
+        Returns:
+            True if the listener is active
+        """
+        if self.listener is None:
+            return False
+        if self.listener.active:
+            return True
+        if time.monotonic() < self._listen_retry_at:
+            return False
+
+        try:
+            # Release a dead connection before checking out a new one
+            await self.listener.stop()
+            await self.listener.start()
+        except Exception as e:
+            # Log the switch to polling once, not every retry
+            if not self._listen_failing:
+                warning(get_worker_logger(), "Could not LISTEN for new jobs, polling instead", context={
+                    "error": str(e),
+                    "error_type": type(e).__name__,
+                    "retry_in_seconds": self._listen_retry_delay,
+                })
+            self._listen_failing = True
+            self._listen_retry_at = time.monotonic() + self._listen_retry_delay
+            self._listen_retry_delay = min(self._listen_retry_delay * 2, LISTEN_RETRY_MAX_SECONDS)
+            return False
+
+        if self._listen_failing:
+            info(get_worker_logger(), "LISTEN restored, no longer polling")
+        self._listen_failing = False
+        self._listen_retry_delay = LISTEN_RETRY_SECONDS
+        self._listen_retry_at = 0.0
+        return True
+
+    async def _wait_for_jobs(self, timeout: float):
+        """Sleep up to timeout seconds, returning early on a new-job NOTIFY"""
+        if self.listener is not None and self.listener.active:
+            if await self.listener.wait(timeout):
+                await self._notify_jitter()
+        else:
+            await self._sleep(timeout)
+
+    async def _notify_jitter(self):
+        """Spread out the claims of workers woken by the same NOTIFY"""
+        await self._sleep(random.random() * self.poll_interval * NOTIFY_JITTER_FRACTION)
+
+    async def _wait_idle(self):
+        """
+        Wait for work when the queue is empty and nothing is running
+
+        With a listener, enqueues wake the worker immediately and the
+        max_poll_interval timeout only picks up delayed/retried jobs;
+        without one, fall back to adaptive backoff polling.
+        """
+        if await self._ensure_listener():
+            if await self.listener.wait(self.max_poll_interval):
+                await self._notify_jitter()
+        else:
+            await self._apply_backoff()
+
     async def _apply_backoff(self):
         """
-        Apply exponential backoff when no jobs are available
-        Gradually increases wait time up to max_poll_interval
+        Back off when no jobs are available
+
+        The target interval is poll_interval divided by the recent claim
+        hit-rate, clamped to [poll_interval, max_poll_interval]: busy queues
+        keep polling fast, idle ones settle at max_poll_interval. The interval
+        drops to the target at once but grows by at most backoff_factor per
+        empty poll.
         """
         old_interval = self.current_poll_interval
 
-        # Increase poll interval with backoff factor
-        self.current_poll_interval = min(
-            self.current_poll_interval * self.backoff_factor,
-            self.max_poll_interval
+        rate = sum(self._hits) / len(self._hits) if self._hits else 0
+        target = min(
+            self.max_poll_interval,
+            max(self.poll_interval, self.poll_interval / max(rate, 1 / CLAIM_HIT_WINDOW))
         )
-
-        debug(worker_logger, "Applying backoff", context={
-            "old_interval": round(old_interval, 2),
-            "new_interval": round(self.current_poll_interval, 2),
-            "max_interval": self.max_poll_interval
-        })
+        self.current_poll_interval = min(target, old_interval * self.backoff_factor)
+
+        if get_worker_logger().isEnabledFor(logging.DEBUG):
+            debug(get_worker_logger(), "Applying backoff", context={
+                **self._base_ctx,
+                "old_interval": round(old_interval, 2),
+                "new_interval": round(self.current_poll_interval, 2),
+                "max_interval": self.max_poll_interval
+            })
 
         # Wait for current poll interval
-        await asyncio.sleep(self.current_poll_interval)
+        await self._sleep(self.current_poll_interval)
 
     async def _shutdown(self):
         """
         Perform graceful shutdown
         Log final statistics and cleanup
         """
-        warning(worker_logger, "Worker shutting down...", context={
+        warning(get_worker_logger(), "Worker shutting down...", context={
             "worker_id": self.worker_id
         })
 
+        await self._stop_flusher()
+
+        if self.listener is not None:
+            await self.listener.stop()
+
         # Log final statistics
-        info(worker_logger, "Worker statistics", context={
+        info(get_worker_logger(), "Worker statistics", context={
             "worker_id": self.worker_id,
             "jobs_processed": self.jobs_processed,
             "jobs_succeeded": self.jobs_succeeded,
@@ -520,7 +589,7 @@ class Worker:
             "success_rate": f"{(self.jobs_succeeded / self.jobs_processed * 100) if self.jobs_processed > 0 else 0:.2f}%"
         })
 
-        info(worker_logger, "Worker stopped gracefully", context={
+        info(get_worker_logger(), "Worker stopped gracefully", context={
             "worker_id": self.worker_id
         })
 
@@ -529,50 +598,44 @@ class Worker:
         Stop the worker gracefully
         Can be called programmatically to stop the worker
         """
-        warning(worker_logger, "Stop requested", context={
+        warning(get_worker_logger(), "Stop requested", context={
             "worker_id": self.worker_id
         })
-        self.should_shutdown = True
+        self._request_shutdown()
 
-    def _available_slots(self) -> int:
+    async def _reserve_slots(self) -> int:
         """
-        Calculates how many job slots are available
-        :return:
-            Number of slots available (0 if all slots are full)
-        """
-        available = self.max_concurrent_jobs - len(self.active_jobs)
-        return available
+        Wait for a free job slot, then take every other slot free right now
 
-    async def _cleanup_completed_tasks(self):
+        Returns:
+            Number of slots reserved (at least 1)
         """
-        Find and remove completed jobs from active_jobs set
-        This frees up slots for jobs
+        await self._slots.acquire()
+        reserved = 1
+        while not self._slots.locked():
+            await self._slots.acquire()
+            reserved += 1
+        return reserved
+
+    def _release_slots(self, count: int):
+        """Give back slots that were reserved but not used"""
+        for _ in range(count):
+            self._slots.release()
+
+    def _on_task_done(self, task: asyncio.Task):
         """
-        completed = {task for task in self.active_jobs if task.done()}
-
-        if completed:
-            debug(worker_logger, f"Cleaning up {len(completed)} completed tasks", context={
-                "completed_count": len(completed),
-                "remaining_active": len(self.active_jobs) - len(completed)
-            })
-
-            for task in completed:
-                try:
-                    # This will raise exception if task failed
-                    await task
-                except Exception as e:
-                    pass
-
-            # Remove completed tasks from active set
-            self.active_jobs -= completed
-
-
-
-
-
-
-
-
-
+        Done-callback for job tasks: release the slot and surface any
+        exception that escaped __process_job_async
+        """
+        self.active_jobs.discard(task)
+        self._slots.release()
 
+        if task.cancelled():
+            return
 
+        exc = task.exception()
+        if exc is not None:
+            error(get_worker_logger(), "Job task raised an unhandled exception", context={
+                "error": str(exc),
+                "error_type": type(exc).__name__,
+            })